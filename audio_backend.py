@@ -5,54 +5,166 @@ No Windows, PyAudio pode travar; sounddevice costuma funcionar melhor.
 """
 from __future__ import annotations
 
+import collections
 import logging
+import operator
+import os
 import platform
+import threading
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
 _BACKEND = None
 _BACKEND_NAME = None
+_pyaudio_module = None  # módulo pyaudio importado uma única vez em _init_backend
 IS_WINDOWS = platform.system() == "Windows"
+IS_MACOS = platform.system() == "Darwin"
 
+_INIT_LOCK = threading.Lock()  # evita dois PyAudio() se get_backend() for chamado em paralelo
 
-def _init_backend():
-    global _BACKEND, _BACKEND_NAME
+DEVICES_CACHE_TTL = 2.0
+DEFAULT_BLOCKSIZE = 1024  # frames por bloco quando o chamador não escolhe (normalizado por taxa)
+_KEYS = ("index", "name", "maxInputChannels", "maxOutputChannels", "defaultSampleRate")
+_DEV_KEYS = operator.itemgetter(*_KEYS)  # extrai os 5 campos do dict do PyAudio numa chamada
 
-    if _BACKEND is not None:
-        return _BACKEND
 
-    # No Windows: tenta sounddevice primeiro (PyAudio costuma travar)
-    if IS_WINDOWS:
-        try:
-            import sounddevice as sd
-            _BACKEND = _SoundDeviceBackend(sd)
-            _BACKEND_NAME = "sounddevice"
-            logger.info("Backend de áudio: sounddevice")
-            return _BACKEND
-        except Exception as e:
-            logger.warning(f"sounddevice não disponível: {e}")
+@dataclass(frozen=True)
+class DeviceTable:
+    """Lista de dispositivos em colunas paralelas (uma tupla por campo), somente leitura.
+
+    A mesma instância é devolvida a todos os chamadores enquanto o cache vale, por isso nada
+    aqui é mutável. Consumidores quentes leem as colunas; iterar ou indexar devolve mappings
+    somente leitura com as chaves de _KEYS (compatível com o formato antigo), montados uma vez.
+    """
+    indices: tuple = ()
+    names: tuple = ()
+    max_input: tuple = ()
+    max_output: tuple = ()
+    sample_rate: tuple = ()
+    _rows: tuple = field(default=(), init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_rows", tuple(
+            MappingProxyType(dict(zip(_KEYS, row)))
+            for row in zip(self.indices, self.names, self.max_input, self.max_output, self.sample_rate)
+        ))
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Monta a tabela a partir de tuplas na ordem de _KEYS."""
+        return cls(*zip(*rows)) if rows else cls()
+
+    def input_positions(self):
+        """Posições (não índices PortAudio) dos dispositivos com canais de entrada."""
+        return [i for i, n in enumerate(self.max_input) if n > 0]
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __getitem__(self, i):
+        return self._rows[i]
+
+    def __iter__(self):
+        return iter(self._rows)
+
+
+def _try_elevate_priority():
+    """Eleva a prioridade do thread atual (chamado no primeiro callback de áudio).
+
+    Windows: THREAD_PRIORITY_TIME_CRITICAL; Linux: SCHED_FIFO; macOS: QoS user-interactive.
+    Sem permissão (ex: Linux sem CAP_SYS_NICE) apenas registra em debug e segue.
+    """
+    try:
+        if IS_WINDOWS:
+            import ctypes
+            k32 = ctypes.windll.kernel32
+            k32.SetThreadPriority(k32.GetCurrentThread(), 15)  # THREAD_PRIORITY_TIME_CRITICAL
+        elif IS_MACOS:
+            import ctypes
+            libc = ctypes.CDLL("/usr/lib/libSystem.dylib")
+            libc.pthread_set_qos_class_self_np(0x21, 0)  # QOS_CLASS_USER_INTERACTIVE
+        elif hasattr(os, "sched_setscheduler"):
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(80))
+    except (PermissionError, OSError, AttributeError) as e:
+        logger.debug(f"Prioridade do thread de áudio não elevada: {e}")
+
+
+def _normalize_blocksize(rate, req):
+    """Arredonda o tamanho de bloco para a potência de 2 mais próxima, entre 16 frames e 40 ms.
+
+    Blocos potência de 2 casam com o período do driver e com FFTs no processamento seguinte.
+    """
+    req = max(int(req), 1)
+    lo = req.bit_length() - 1  # 2**lo <= req < 2**(lo + 1)
+    exp = lo + 1 if req - (1 << lo) > (1 << (lo + 1)) - req else lo
+    cap = max(4, int(rate * 0.040).bit_length() - 1)  # floor(log2(frames em 40 ms))
+    size = 1 << max(4, min(exp, cap))
+    if size != req:
+        logger.debug(f"Bloco de áudio ajustado: {req} -> {size} frames @ {rate} Hz")
+    return size
+
+
+def _block_frames(rate, chunk_size):
+    """Tamanho explícito do chamador é respeitado; sem ele, DEFAULT_BLOCKSIZE normalizado."""
+    if chunk_size is None:
+        return _normalize_blocksize(rate, DEFAULT_BLOCKSIZE)
+    return int(chunk_size)
+
+
+def _downmix_stereo_int16(np, buf):
+    """PCM int16 estéreo intercalado -> ndarray int16 mono, (L + R) >> 1 vetorizado."""
+    if len(buf) % 4:
+        raise ValueError(
+            f"PCM estéreo int16 deve ter múltiplo de 4 bytes (quadros L+R completos); recebeu {len(buf)}"
+        )
+    lr = np.frombuffer(buf, dtype=np.int16).reshape(-1, 2)
+    mono = lr[:, 0].astype(np.int32)
+    mono += lr[:, 1]
+    mono >>= 1
+    return mono.astype(np.int16)
+
+
+def _try_sounddevice():
+    try:
+        import sounddevice as sd
+        return _SoundDeviceBackend(sd), "sounddevice"
+    except Exception as e:
+        logger.warning(f"sounddevice não disponível: {e}")
+        return None
+
 
-    # PyAudio (padrão no macOS/Linux, fallback no Windows)
+def _try_pyaudio():
+    global _pyaudio_module
     try:
         import pyaudio
         pa = pyaudio.PyAudio()
-        _BACKEND = _PyAudioBackend(pa)
-        _BACKEND_NAME = "pyaudio"
-        logger.info("Backend de áudio: PyAudio")
-        return _BACKEND
+        _pyaudio_module = pyaudio
+        return _PyAudioBackend(pa), "PyAudio"
     except Exception as e:
         logger.warning(f"PyAudio não disponível: {e}")
+        return None
 
-    # Fallback: sounddevice (se não tentamos antes)
-    if not IS_WINDOWS:
-        try:
-            import sounddevice as sd
-            _BACKEND = _SoundDeviceBackend(sd)
-            _BACKEND_NAME = "sounddevice"
-            logger.info("Backend de áudio: sounddevice")
+
+# No Windows sounddevice vem primeiro (PyAudio costuma travar); no macOS/Linux, PyAudio
+_ATTEMPT_ORDER = (_try_sounddevice, _try_pyaudio) if IS_WINDOWS else (_try_pyaudio, _try_sounddevice)
+
+
+def _init_backend():
+    global _BACKEND, _BACKEND_NAME
+
+    if _BACKEND is not None:
+        return _BACKEND
+
+    for attempt in _ATTEMPT_ORDER:
+        result = attempt()
+        if result is not None:
+            _BACKEND, label = result
+            _BACKEND_NAME = label.lower()
+            logger.info(f"Backend de áudio: {label}")
             return _BACKEND
-        except Exception as e:
-            logger.warning(f"sounddevice não disponível: {e}")
 
     raise RuntimeError(
         "Nenhum backend de áudio disponível.\n"
@@ -62,64 +174,79 @@ def _init_backend():
 
 
 def get_backend():
-    if _BACKEND is None:
-        _init_backend()
-    return _BACKEND
+    backend = _BACKEND
+    if backend is not None:  # caminho rápido, sem lock
+        return backend
+    with _INIT_LOCK:
+        return _init_backend()  # _init_backend revalida _BACKEND dentro do lock
 
 
 def get_backend_name():
     if _BACKEND_NAME is None:
-        _init_backend()
+        get_backend()
     return _BACKEND_NAME
 
 
 class _PyAudioBackend:
+    __slots__ = ("_pa", "_devices_cache", "_devices_cache_ts", "_fmt_int16", "_pa_continue")
+
     def __init__(self, pa):
         self._pa = pa
+        # Constantes do PyAudio resolvidas uma vez, não a cada abertura de stream
+        self._fmt_int16 = _pyaudio_module.paInt16
+        self._pa_continue = _pyaudio_module.paContinue
+        self._devices_cache = None
+        self._devices_cache_ts = 0.0
+
+    def invalidate_devices(self):
+        """Descarta a lista em cache (ex: após conectar/desconectar um dispositivo)."""
+        self._devices_cache = None
 
     def get_devices(self):
-        devices = []
+        now = time.monotonic()
+        if self._devices_cache is not None and now - self._devices_cache_ts < DEVICES_CACHE_TTL:
+            return self._devices_cache
+        rows = []
         for i in range(self._pa.get_device_count()):
             try:
-                info = self._pa.get_device_info_by_index(i)
-                devices.append({
-                    "index": info["index"],
-                    "name": info["name"],
-                    "maxInputChannels": info["maxInputChannels"],
-                    "maxOutputChannels": info["maxOutputChannels"],
-                    "defaultSampleRate": info["defaultSampleRate"],
-                })
+                rows.append(_DEV_KEYS(self._pa.get_device_info_by_index(i)))
             except Exception:
                 pass
+        devices = DeviceTable.from_rows(rows)
+        self._devices_cache = devices
+        self._devices_cache_ts = now
         return devices
 
-    def open_input_stream(self, channels, rate, chunk_size, device_index, callback):
-        import pyaudio
-
-        def _pa_cb(in_data, frame_count, time_info, status):
-            callback(in_data, frame_count, time_info, status)
-            return (None, pyaudio.paContinue)
-
-        fmt = self._pa.get_format_from_width(2)
+    def open_input_stream(self, channels, rate, chunk_size, device_index, callback, latency="low",
+                          direct_callback=False):
+        """chunk_size=None escolhe um bloco potência de 2 para a taxa; um valor explícito é usado como veio."""
+        # PyAudio.open não expõe suggestedLatency: o módulo C já usa defaultLowInputLatency
+        # do dispositivo, que equivale a latency="low". O parâmetro existe por simetria.
+        # direct_callback=True chama o callback no thread de áudio (só para callbacks rápidos).
+        chunk_size = _block_frames(rate, chunk_size)
+        dispatch = None if direct_callback else _RTDispatch(callback)
+        deliver = callback if dispatch is None else dispatch.push
         stream = self._pa.open(
-            format=fmt,
+            format=self._fmt_int16,
             channels=channels,
             rate=rate,
             input=True,
             input_device_index=device_index,
             frames_per_buffer=chunk_size,
-            stream_callback=_pa_cb,
+            stream_callback=_PAInputCallback(deliver, self._pa_continue),
         )
-        return _PyAudioStream(stream, self._pa)
+        # Thread só depois do open: se o open falhar não sobra thread parado no Event
+        if dispatch is not None:
+            dispatch.start()
+        return _PyAudioStream(stream, self._pa, dispatch)
 
-    def open_output_stream(self, channels, rate, chunk_size):
-        fmt = self._pa.get_format_from_width(2)
+    def open_output_stream(self, channels, rate, chunk_size=None):
         stream = self._pa.open(
-            format=fmt,
+            format=self._fmt_int16,
             channels=channels,
             rate=rate,
             output=True,
-            frames_per_buffer=chunk_size,
+            frames_per_buffer=_block_frames(rate, chunk_size),
         )
         return _PyAudioStream(stream, self._pa)
 
@@ -131,9 +258,12 @@ class _PyAudioBackend:
 
 
 class _PyAudioStream:
-    def __init__(self, stream, pa):
+    __slots__ = ("_stream", "_pa", "_dispatch")
+
+    def __init__(self, stream, pa, dispatch=None):
         self._stream = stream
         self._pa = pa
+        self._dispatch = dispatch
 
     def is_active(self):
         return self._stream.is_active()
@@ -143,73 +273,205 @@ class _PyAudioStream:
 
     def close(self):
         self._stream.close()
+        if self._dispatch is not None:
+            self._dispatch.stop()
 
     def write(self, data):
         self._stream.write(data)
 
 
 class _SoundDeviceBackend:
+    __slots__ = ("_sd", "_np", "_devices_cache", "_devices_cache_ts",
+                 "_wasapi_index", "_wasapi_in", "_wasapi_out")
+
     def __init__(self, sd):
         self._sd = sd
+        # numpy só é importado quando o backend sounddevice é escolhido (import lento, ~100 ms)
+        try:
+            import numpy
+            self._np = numpy
+        except ImportError:
+            self._np = None
+        self._devices_cache = None
+        self._devices_cache_ts = 0.0
+        # No Windows prefere WASAPI (o padrão do PortAudio é MME, com 50-200 ms de latência)
+        self._wasapi_index = self._wasapi_in = self._wasapi_out = -1
+        if IS_WINDOWS:
+            try:
+                for i, api in enumerate(sd.query_hostapis()):
+                    if "WASAPI" in api.get("name", ""):
+                        self._wasapi_index = i
+                        self._wasapi_in = api.get("default_input_device", -1)
+                        self._wasapi_out = api.get("default_output_device", -1)
+                        logger.info("sounddevice: usando host API WASAPI")
+                        break
+            except Exception as e:
+                logger.warning(f"Erro ao consultar host APIs: {e}")
+
+    def _wasapi_kwargs(self, kwargs, output, exclusive):
+        """Cópia de kwargs com dispositivo/extra_settings WASAPI, ou o próprio kwargs se não se aplica."""
+        if self._wasapi_index < 0:
+            return kwargs
+        device = kwargs.get("device")
+        if device is None:
+            device = self._wasapi_out if output else self._wasapi_in
+            if device < 0:
+                return kwargs
+        else:
+            try:
+                if self._sd.query_devices(device)["hostapi"] != self._wasapi_index:
+                    return kwargs
+            except Exception:
+                return kwargs
+        try:
+            settings = self._sd.WasapiSettings(exclusive=exclusive)
+        except Exception:
+            return kwargs
+        return dict(kwargs, device=device, extra_settings=settings)
+
+    def _open_stream(self, factory, kwargs, output=False, exclusive=False):
+        """Abre via WASAPI quando disponível; se falhar, reabre com a host API padrão."""
+        wasapi = self._wasapi_kwargs(kwargs, output, exclusive)
+        if wasapi is kwargs:
+            return factory(**kwargs)
+        try:
+            return factory(**wasapi)
+        except Exception as e:
+            logger.warning(f"WASAPI falhou ({e}); usando host API padrão")
+            return factory(**kwargs)
+
+    def invalidate_devices(self):
+        """Descarta a lista em cache (ex: após conectar/desconectar um dispositivo)."""
+        self._devices_cache = None
 
     def get_devices(self):
-        devices = []
+        now = time.monotonic()
+        if self._devices_cache is not None and now - self._devices_cache_ts < DEVICES_CACHE_TTL:
+            return self._devices_cache
+        rows = []
         try:
             all_devs = self._sd.query_devices()
             for i, dev in enumerate(all_devs):
-                devices.append({
-                    "index": i,
-                    "name": dev.get("name", f"Device {i}"),
-                    "maxInputChannels": int(dev.get("max_input_channels", 0)),
-                    "maxOutputChannels": int(dev.get("max_output_channels", 0)),
-                    "defaultSampleRate": float(dev.get("default_samplerate", 44100)),
-                })
+                rows.append((
+                    i,
+                    dev.get("name", f"Device {i}"),
+                    int(dev.get("max_input_channels", 0)),
+                    int(dev.get("max_output_channels", 0)),
+                    float(dev.get("default_samplerate", 44100)),
+                ))
         except Exception as e:
             logger.warning(f"Erro ao listar dispositivos: {e}")
+            return DeviceTable.from_rows(rows)
+        devices = DeviceTable.from_rows(rows)
+        self._devices_cache = devices
+        self._devices_cache_ts = now
         return devices
 
-    def open_input_stream(self, channels, rate, chunk_size, device_index, callback):
-        """Usa RawInputStream para evitar numpy no callback (menos travamentos no Windows)."""
-        def _cb(indata, frames, time_info, status):
-            try:
-                data = bytes(indata)  # RawInputStream: buffer -> bytes
-            except TypeError:
-                data = indata.tobytes()  # InputStream fallback: numpy -> bytes
-            callback(data, frames, time_info, status)
+    def open_input_stream(self, channels, rate, chunk_size, device_index, callback,
+                          buffer_pool=0, reuse_buffer=False, latency="low", direct_callback=False,
+                          wasapi_exclusive=False, as_bytes=True):
+        """Usa RawInputStream para evitar numpy no callback (menos travamentos no Windows).
+
+        Com buffer_pool=N os blocos são entregues em N bytearrays pré-alocados, sem alocação
+        no thread de áudio; o consumidor deve devolvê-los com stream.release(buf).
+        Com reuse_buffer=True o callback recebe sempre a mesma memoryview, válida apenas
+        durante a chamada (o consumidor copia o que precisar guardar); exige direct_callback.
+        latency: "low", "high" ou segundos; sem ele o PortAudio usaria a latência alta padrão.
+        wasapi_exclusive: no Windows com WASAPI, abre em modo exclusivo (sem o mixer do sistema).
+        as_bytes=False usa InputStream e entrega o ndarray int16 (frames, canais) sem converter
+        para bytes; write() da saída aceita esse ndarray direto, sem frombuffer.
+
+        Por padrão o callback roda num thread auxiliar (_RTDispatch): o thread de áudio só copia
+        o bloco e sinaliza. Nesse modo time_info chega como None (a struct do PortAudio só vale
+        durante o callback). direct_callback=True chama o callback no próprio thread de áudio.
+        chunk_size=None escolhe um bloco potência de 2 para a taxa; um valor explícito é usado como veio.
+        """
+        chunk_size = _block_frames(rate, chunk_size)
+        block_bytes = chunk_size * channels * 2
+        pool = _BufferPool(buffer_pool, block_bytes) if buffer_pool > 0 else None
+        use_scratch = reuse_buffer and direct_callback and pool is None
+        scratch = bytearray(block_bytes) if use_scratch else None
+        dispatch = None if direct_callback else _RTDispatch(callback)
 
         kwargs = dict(
             channels=channels,
             samplerate=rate,
             blocksize=chunk_size,
             dtype="int16",
-            callback=_cb,
+            latency=latency,
+            callback=_SDInputCallback(callback, dispatch, pool, scratch, block_bytes, as_bytes),
         )
         if device_index is not None:
             kwargs["device"] = device_index
+        factory = self._new_input_stream if as_bytes else self._sd.InputStream
+        stream = self._open_stream(factory, kwargs, exclusive=wasapi_exclusive)
         try:
-            stream = self._sd.RawInputStream(**kwargs)
+            stream.start()
+        except Exception:
+            stream.close()
+            raise
+        # Thread só depois do stream aberto e iniciado: numa falha não sobra thread parado no Event
+        if dispatch is not None:
+            dispatch.start()
+        return _SoundDeviceStream(stream, self._np, pool=pool, dispatch=dispatch)
+
+    def _new_input_stream(self, **kwargs):
+        try:
+            return self._sd.RawInputStream(**kwargs)
         except (AttributeError, TypeError):
-            stream = self._sd.InputStream(**kwargs)
-        stream.start()
-        return _SoundDeviceStream(stream)
+            return self._sd.InputStream(**kwargs)
 
-    def open_output_stream(self, channels, rate, chunk_size):
-        stream = self._sd.OutputStream(
+    def open_output_stream(self, channels, rate, chunk_size=None, use_callback=False, buffered=False):
+        """Por padrão usa write() bloqueante, sem callback Python: o PortAudio controla o timing em C.
+
+        Com use_callback=True abre um RawOutputStream cujo callback consome uma fila interna.
+        Com buffered=True write() só enfileira (~200 ms) e um thread próprio faz o write
+        bloqueante, absorvendo rajadas do produtor.
+        """
+        chunk_size = _block_frames(rate, chunk_size)
+        kwargs = dict(
             channels=channels,
             samplerate=rate,
             blocksize=chunk_size,
             dtype="int16",
+            latency="high",
         )
+        if use_callback:
+            feeder = _OutputFeeder()
+            kwargs["callback"] = feeder
+            stream = self._open_stream(self._sd.RawOutputStream, kwargs, output=True)
+            stream.start()
+            return _SoundDeviceCallbackStream(stream, self._np, feeder)
+        stream = self._open_stream(self._sd.OutputStream, kwargs, output=True)
         stream.start()
-        return _SoundDeviceStream(stream)
+        out = _SoundDeviceStream(stream, self._np, channels=channels, max_frames=chunk_size)
+        if buffered:
+            return _BufferedOutput(out, max(2, -(-int(rate * 0.2) // chunk_size)))
+        return out
 
     def terminate(self):
         pass
 
 
 class _SoundDeviceStream:
-    def __init__(self, stream):
+    __slots__ = ("_stream", "_np", "_int16", "_ndarray", "_channels", "_buf", "_mv",
+                 "_pool", "_dispatch")
+
+    def __init__(self, stream, np_module, channels=1, max_frames=0, pool=None, dispatch=None):
         self._stream = stream
+        self._np = np_module
+        self._int16 = np_module.int16 if np_module is not None else None
+        self._ndarray = np_module.ndarray if np_module is not None else ()
+        self._channels = channels
+        self._pool = pool
+        self._dispatch = dispatch
+        # Buffer 2D (frames, canais) reaproveitado em write(): sem ndarray novo nem reshape por bloco
+        if np_module is not None and max_frames > 0:
+            self._buf = np_module.empty((max_frames, channels), dtype=self._int16)
+            self._mv = memoryview(self._buf.reshape(-1).view(np_module.uint8))
+        else:
+            self._buf = None
+            self._mv = None
 
     def is_active(self):
         return self._stream.active
@@ -219,11 +481,260 @@ class _SoundDeviceStream:
 
     def close(self):
         self._stream.close()
+        if self._dispatch is not None:
+            self._dispatch.stop()
+
+    def write_stereo_as_mono(self, data):
+        """Escreve PCM int16 estéreo num stream mono, fazendo o downmix em numpy."""
+        self.write(_downmix_stereo_int16(self._np, data).reshape(-1, 1))
+
+    def release(self, buf):
+        """Devolve ao pool um buffer recebido no callback de entrada."""
+        if self._pool is not None:
+            self._pool.release(buf)
 
     def write(self, data):
         try:
-            import numpy as np
-            arr = np.frombuffer(data, dtype=np.int16)
-            self._stream.write(arr)
+            if isinstance(data, self._ndarray):
+                self._stream.write(data)
+                return
+            n = len(data)
+            if self._mv is not None and n <= len(self._mv):
+                self._mv[:n] = data
+                self._stream.write(self._buf[:n // (2 * self._channels)])
+                return
+            self._stream.write(self._np.frombuffer(data, dtype=self._int16).reshape(-1, self._channels))
         except Exception:
             pass
+
+
+
+class _PAInputCallback:
+    """Callback de entrada do PyAudio (objeto com __slots__ em vez de closure)."""
+
+    __slots__ = ("deliver", "pa_continue", "elevated")
+
+    def __init__(self, deliver, pa_continue):
+        self.deliver = deliver
+        self.pa_continue = pa_continue
+        self.elevated = False
+
+    def __call__(self, in_data, frame_count, time_info, status):
+        if not self.elevated:
+            self.elevated = True
+            _try_elevate_priority()
+        self.deliver(in_data, frame_count, time_info, status)
+        return (None, self.pa_continue)
+
+
+class _SDInputCallback:
+    """Callback de entrada do sounddevice: copia o bloco (pool, scratch ou bytes) e entrega."""
+
+    __slots__ = ("callback", "dispatch", "pool", "scratch", "scratch_view",
+                 "block_bytes", "as_bytes", "elevated")
+
+    def __init__(self, callback, dispatch, pool, scratch, block_bytes, as_bytes):
+        self.callback = callback
+        self.dispatch = dispatch
+        self.pool = pool
+        self.scratch = scratch
+        self.scratch_view = memoryview(scratch) if scratch is not None else None
+        self.block_bytes = block_bytes
+        self.as_bytes = as_bytes
+        self.elevated = False
+
+    def __call__(self, indata, frames, time_info, status):
+        if not self.elevated:
+            self.elevated = True
+            _try_elevate_priority()
+        dispatch = self.dispatch
+        if not self.as_bytes:
+            # O ndarray do callback aponta para o buffer do PortAudio: copia se sair do callback
+            data = indata if dispatch is None else indata.copy()
+        elif self.pool is not None and len(indata) == self.block_bytes:
+            data = self.pool.acquire()
+            data[:] = indata  # memcpy para o buffer reaproveitado
+        elif self.scratch is not None and len(indata) == self.block_bytes:
+            self.scratch[:] = indata
+            data = self.scratch_view
+        else:
+            # bytes() aceita tanto o buffer cffi do RawInputStream quanto o ndarray do InputStream
+            data = bytes(indata)
+        if dispatch is None:
+            self.callback(data, frames, time_info, status)
+        else:
+            dispatch.push(data, frames, None, status)
+
+
+class _RTDispatch:
+    """Entrega os blocos de entrada ao callback do usuário num thread auxiliar.
+
+    O thread de áudio só faz push() (append + set); se o consumidor atrasar, a deque
+    limitada descarta os blocos mais antigos em vez de bloquear o PortAudio. Os descartes
+    ficam em dropped e são logados pelo thread auxiliar (nunca pelo thread de áudio).
+    O thread auxiliar só sobe em start(), chamado depois que o stream abriu.
+    """
+
+    __slots__ = ("_queue", "_event", "_callback", "_running", "_thread", "dropped", "_reported")
+
+    def __init__(self, callback, maxlen=8):
+        self._queue = collections.deque(maxlen=maxlen)
+        self._event = threading.Event()
+        self._callback = callback
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="AudioDispatch", daemon=True)
+        self.dropped = 0
+        self._reported = 0
+
+    def start(self):
+        self._thread.start()
+
+    def push(self, data, frames, time_info, status):
+        queue = self._queue
+        if len(queue) == queue.maxlen:
+            self.dropped += 1  # o append abaixo descarta o bloco mais antigo
+        queue.append((data, frames, time_info, status))
+        self._event.set()
+
+    def _run(self):
+        queue = self._queue
+        callback = self._callback
+        while self._running:
+            self._event.wait()
+            self._event.clear()
+            while queue:
+                try:
+                    item = queue.popleft()
+                except IndexError:
+                    break
+                try:
+                    callback(*item)
+                except Exception as e:
+                    logger.warning(f"Erro no callback de áudio: {e}")
+            dropped = self.dropped
+            if dropped != self._reported:
+                logger.warning(
+                    f"Callback de áudio atrasado: {dropped - self._reported} bloco(s) de entrada "
+                    f"descartado(s) (total {dropped})"
+                )
+                self._reported = dropped
+
+    def stop(self):
+        self._running = False
+        self._event.set()
+        if self._thread.ident is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+
+
+class _BufferPool:
+    """Free-list de bytearrays de tamanho fixo; acquire/release em tempo constante."""
+
+    __slots__ = ("size", "_free")
+
+    def __init__(self, n, size):
+        self.size = size
+        self._free = collections.deque(bytearray(size) for _ in range(n))
+
+    def acquire(self):
+        try:
+            return self._free.pop()
+        except IndexError:
+            return bytearray(self.size)  # pool esgotado: consumidor atrasado, aloca um extra
+
+    def release(self, buf):
+        if len(buf) == self.size:
+            self._free.append(buf)
+
+
+class _OutputFeeder:
+    """Callback de saída: copia blocos PCM de uma fila para o buffer do PortAudio."""
+
+    __slots__ = ("queue", "_pending")
+
+    def __init__(self):
+        self.queue = collections.deque()
+        self._pending = None
+
+    def __call__(self, outdata, frames, time_info, status):
+        need = len(outdata)
+        pos = 0
+        while pos < need:
+            if self._pending is None:
+                try:
+                    self._pending = memoryview(self.queue.popleft())
+                except IndexError:
+                    break
+            take = min(need - pos, len(self._pending))
+            outdata[pos:pos + take] = self._pending[:take]
+            pos += take
+            self._pending = self._pending[take:] if take < len(self._pending) else None
+        if pos < need:
+            outdata[pos:need] = bytes(need - pos)  # underrun: completa com silêncio
+
+
+class _SoundDeviceCallbackStream(_SoundDeviceStream):
+    __slots__ = ("_feeder",)
+
+    def __init__(self, stream, np_module, feeder):
+        super().__init__(stream, np_module)
+        self._feeder = feeder
+
+    def write(self, data):
+        self._feeder.queue.append(bytes(data))
+
+
+class _BufferedOutput:
+    """Fila entre o produtor e um stream de saída; um thread dedicado faz o write() bloqueante.
+
+    A fila comporta max_blocks blocos; se o produtor adiantar mais que isso, os mais antigos
+    são descartados. close() esvazia a fila antes de fechar o stream.
+    """
+
+    __slots__ = ("_out", "_ring", "_event", "_running", "_thread")
+
+    def __init__(self, out, max_blocks):
+        self._out = out
+        self._ring = collections.deque(maxlen=max_blocks)
+        self._event = threading.Event()
+        self._running = True
+        self._thread = threading.Thread(target=self._pump, name="AudioOutputPump", daemon=True)
+        self._thread.start()
+
+    def _pump(self):
+        ring = self._ring
+        write = self._out.write
+        while True:
+            while ring:
+                try:
+                    data = ring.popleft()
+                except IndexError:
+                    break
+                write(data)
+            if not self._running:
+                return
+            self._event.wait()
+            self._event.clear()
+
+    def write(self, data):
+        # Copia: o produtor pode reutilizar o buffer logo após write()
+        self._ring.append(data if isinstance(data, bytes) else bytes(data))
+        self._event.set()
+
+    def write_stereo_as_mono(self, data):
+        """Faz o downmix no thread do produtor e enfileira o bloco mono."""
+        self.write(_downmix_stereo_int16(self._out._np, data).tobytes())
+
+    def is_active(self):
+        return self._out.is_active()
+
+    def stop_stream(self):
+        self._out.stop_stream()
+
+    def close(self):
+        self._running = False
+        self._event.set()
+        self._thread.join(timeout=1.0)
+        self._out.close()
+
+    def release(self, buf):
+        self._out.release(buf)
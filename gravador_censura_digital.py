@@ -9,12 +9,15 @@ validação de WAV pós-gravação e métricas de gravação.
 """
 from __future__ import annotations
 
-import array
+import gc
 import math
+import numpy as np
 import pyaudio
 import shutil
+import struct
 import wave
 import os
+import platform
 import threading
 import time
 from dataclasses import dataclass, field
@@ -28,6 +31,165 @@ STREAM_RETRY_MAX = 3
 STREAM_RETRY_DELAY = 2.0
 MIN_DISK_SPACE_MB = 500
 MIN_WAV_SIZE_BYTES = 1024
+LEVEL_UPDATE_HZ = 20
+WAV_WRITE_BATCH_BYTES = 64 * 1024  # acumula ~0,7 s de áudio (44,1 kHz mono) por write no disco
+CHUNK_MAX_WALL_FACTOR = 1.5  # teto de relógio do chunk, em múltiplos da duração, se as leituras falharem
+
+
+# Atributos do numpy resolvidos uma vez: o laço de gravação chama estas funções ~43x/s
+_INT16 = np.int16
+_INT64 = np.int64
+_FLOAT32 = np.float32
+_frombuffer = np.frombuffer
+_einsum = np.einsum
+_multiply = np.multiply
+_clip = np.clip
+_empty = np.empty
+_sqrt = math.sqrt
+
+
+def _rms_i16(pcm) -> float:
+    n = pcm.shape[0]
+    if n == 0:
+        return 0.0
+    sum_sq = int(_einsum("i,i->", pcm, pcm, dtype=_INT64))
+    return min(_sqrt(sum_sq / n) / 32768.0, 1.0)
+
+
+def _scale_i16(pcm, volume: float, scratch) -> bytes:
+    """Escala com saturação em int16; scratch é um par (float32, int16) pré-alocado.
+
+    Se o bloco couber no scratch, evita os temporários do numpy e só resta a cópia de
+    tobytes() (PyAudio.write exige bytes).
+    """
+    n = pcm.shape[0]
+    if scratch is not None and scratch[0].shape[0] >= n:
+        work, out = scratch[0][:n], scratch[1][:n]
+    else:
+        work, out = _empty(n, dtype=_FLOAT32), _empty(n, dtype=_INT16)
+    _multiply(pcm, _FLOAT32(volume), out=work)
+    _clip(work, -32768, 32767, out=work)
+    out[...] = work
+    return out.tobytes()
+
+
+def _process_chunk(data: bytes, volume: Optional[float], scratch=None, level: bool = True):
+    """Nível RMS e, se volume não for None, PCM escalado para o monitor, com uma só view int16.
+
+    Retorna (rms, scaled); rms é None se level=False, scaled é None sem monitor e o próprio
+    data com volume 1.0.
+    """
+    pcm = _frombuffer(data, dtype=_INT16)
+    rms = _rms_i16(pcm) if level else None
+    if volume is None:
+        return rms, None
+    if volume == 1.0:
+        return rms, data
+    return rms, _scale_i16(pcm, volume, scratch)
+
+
+def _tune_recording_thread(logger: logging.Logger):
+    """Prioridade alta e, no Linux, afinidade com o último núcleo para o thread atual.
+
+    No Windows fica em HIGHEST, não TIME_CRITICAL: o thread também grava em disco e não pode
+    esfomear a interface e os threads de streaming. No Linux, SCHED_FIFO exige root ou CAP_SYS_NICE (ex: setcap cap_sys_nice+ep no python);
+    sem permissão a gravação segue com a prioridade normal.
+    """
+    if platform.system() == "Windows":
+        try:
+            import ctypes
+            k32 = ctypes.windll.kernel32
+            k32.SetThreadPriority(k32.GetCurrentThread(), 2)  # THREAD_PRIORITY_HIGHEST
+        except Exception as e:
+            logger.debug("Prioridade do thread de gravação não alterada: %s", e)
+        return
+    if hasattr(os, "sched_setaffinity"):
+        try:
+            cpus = sorted(os.sched_getaffinity(0))
+            if len(cpus) > 1:
+                os.sched_setaffinity(0, {cpus[-1]})  # 0 = thread atual no Linux
+        except OSError as e:
+            logger.debug("Afinidade do thread de gravação não alterada: %s", e)
+    if hasattr(os, "sched_setscheduler"):
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(10))
+        except (PermissionError, OSError) as e:
+            logger.debug("SCHED_FIFO indisponível (requer CAP_SYS_NICE): %s", e)
+
+
+class _WavChunkWriter:
+    """Grava um WAV PCM com cabeçalho RIFF escrito uma vez na abertura e PCM anexado cru.
+
+    O cabeçalho já declara o tamanho esperado do chunk; no close() só é corrigido (seek +
+    dois campos de 4 bytes) se o total gravado for diferente, ex: chunk interrompido.
+    """
+
+    _HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+    _MAX_DATA = 0xFFFFFFFF - 36
+
+    __slots__ = ("_f", "_declared", "_written")
+
+    def __init__(self, path: str, channels: int, sampwidth: int, rate: int, expected_bytes: int):
+        self._f = open(path, "wb")
+        if hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(self._f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass
+        self._written = 0
+        self._declared = min(int(expected_bytes), self._MAX_DATA)
+        block_align = channels * sampwidth
+        self._f.write(self._HEADER.pack(
+            b"RIFF", 36 + self._declared, b"WAVE",
+            b"fmt ", 16, 1, channels, rate, rate * block_align, block_align, sampwidth * 8,
+            b"data", self._declared,
+        ))
+
+    def write(self, data):
+        self._f.write(data)
+        self._written += len(data)
+
+    def close(self):
+        f = self._f
+        if f is None:
+            return
+        self._f = None
+        try:
+            size = min(self._written, self._MAX_DATA)
+            if size & 1:
+                f.write(b"\x00")  # chunk RIFF de tamanho ímpar leva byte de preenchimento
+            if size != self._declared:
+                f.seek(4)
+                f.write(struct.pack("<I", 36 + size + (size & 1)))
+                f.seek(40)
+                f.write(struct.pack("<I", size))
+            f.flush()
+        except BaseException:
+            f.close()
+            raise
+        # O gravador não relê o chunk: grava em disco e libera as páginas do page cache para não
+        # expulsar dados úteis de outros processos numa máquina 24/7. O fsync pode demorar, então
+        # roda fora do thread de gravação, que precisa voltar logo às leituras do próximo chunk.
+        if hasattr(os, "posix_fadvise"):
+            threading.Thread(target=self._sync_and_drop, args=(f,), name="WavChunkSync", daemon=True).start()
+        else:
+            f.close()
+
+    @staticmethod
+    def _sync_and_drop(f):
+        try:
+            os.fsync(f.fileno())
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+        finally:
+            f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
 
 
 def _deep_merge(base: dict, override: dict) -> dict:
@@ -84,15 +246,19 @@ class CensuraDigital:
         self.is_monitoring = False
         self.monitor_stream = None
         self.monitor_volume = 1.0
+        n = self.config["audio"]["chunk_size"] * self.config["audio"]["channels"]
+        self._monitor_scratch = (np.empty(n, dtype=np.float32), np.empty(n, dtype=np.int16))
 
         self.current_chunk_start: Optional[datetime] = None
         self.chunk_counter = 0
+        self._day_dir_cache: Optional[tuple] = None  # ((pasta_base, data), Path do dia)
 
         self._stream_manager = None
         self.current_level = 0.0
 
         self._alert_callback: Optional[Callable[[str], None]] = None
         self._recording_failed_callback: Optional[Callable[[str], None]] = None
+        self._status_callback: Optional[Callable[[Dict[str, Any]], None]] = None
 
         self._metrics = RecordingMetrics()
         self._stall_count = 0
@@ -134,12 +300,15 @@ class CensuraDigital:
             self.config = default_config
             self.save_config()
 
-    def save_config(self):
+    def save_config(self) -> bool:
+        """Grava o config em disco. Retorna False (e registra o erro) se a gravação falhar."""
         try:
             with open(self.config_file, "w", encoding="utf-8") as f:
                 json.dump(self.config, f, indent=2, ensure_ascii=False)
+            return True
         except Exception as e:
             self.logger.error("Erro ao salvar configuração: %s", e)
+            return False
 
     def setup_logging(self):
         from logging.handlers import RotatingFileHandler
@@ -397,6 +566,7 @@ class CensuraDigital:
                 )
                 self.logger.info("Stream de áudio reaberto com sucesso na tentativa %d.", attempt)
                 self._fire_alert("Stream de áudio recuperado")
+                self._fire_status()
                 return True
             except Exception as e:
                 self.logger.error("Tentativa %d falhou: %s", attempt, e)
@@ -440,12 +610,25 @@ class CensuraDigital:
             except Exception as exc:
                 self.logger.debug("Erro no recording_failed callback: %s", exc)
 
+    def _fire_status(self):
+        if self._status_callback:
+            try:
+                self._status_callback(self.get_status())
+            except Exception as exc:
+                self.logger.debug("Erro no status callback: %s", exc)
+
     # ── Output directory / filename ───────────────────────────────
 
     def create_output_directory(self, date_to_use: date) -> Path:
-        base_dir = Path(self.config["recording"]["output_directory"])
-        date_dir = base_dir / date_to_use.strftime("%Y") / date_to_use.strftime("%m-%d")
+        # Mesmo dia e mesma pasta base do chunk anterior: reaproveita o Path sem strftime/mkdir.
+        # A chave inclui a pasta base porque a interface pode alterá-la em tempo de execução.
+        key = (self.config["recording"]["output_directory"], date_to_use)
+        cached = self._day_dir_cache
+        if cached is not None and cached[0] == key and cached[1].is_dir():
+            return cached[1]
+        date_dir = Path(key[0]) / f"{date_to_use:%Y}" / f"{date_to_use:%m-%d}"
         date_dir.mkdir(parents=True, exist_ok=True)
+        self._day_dir_cache = (key, date_dir)
         return date_dir
 
     def generate_filename(self, start_time: datetime) -> str:
@@ -455,6 +638,14 @@ class CensuraDigital:
     # ── Recording loop ────────────────────────────────────────────
 
     def recording_loop(self):
+        try:
+            self._record()
+        finally:
+            # Desfaz o gc.freeze() de start_recording em toda saída (parada, falha, disco cheio)
+            gc.unfreeze()
+
+    def _record(self):
+        _tune_recording_thread(self.logger)
         if not self._open_streams():
             self.is_recording = False
             self.logger.error("Falha ao abrir streams de áudio. Abortando.")
@@ -464,8 +655,18 @@ class CensuraDigital:
         chunk_duration_seconds = self.config["recording"]["chunk_duration_minutes"] * 60
         max_chunks = self.config["recording"].get("max_chunks_per_day", 48)
         last_chunk_date = None
+        # Parâmetros de áudio fixos durante a gravação: lidos do config uma vez, não por chunk
         ac = self.config["audio"]
         chunk_size = ac["chunk_size"]
+        channels = ac["channels"]
+        rate = ac["rate"]
+        sampwidth = self.audio.get_sample_size(self.get_audio_format())
+        bytes_per_second = rate * channels * sampwidth
+        expected_bytes = chunk_duration_seconds * bytes_per_second
+        # O VU da interface atualiza a ~10 Hz: o RMS só precisa de ~20 Hz. Passo em potência
+        # de 2 para o teste ser um AND com a máscara.
+        level_ratio = max(1, rate // (LEVEL_UPDATE_HZ * chunk_size))
+        level_mask = (1 << (level_ratio.bit_length() - 1)) - 1
 
         while self.is_recording:
             current_date = datetime.now().date()
@@ -493,40 +694,81 @@ class CensuraDigital:
             self._metrics.reset_chunk()
             self._metrics.expected_duration_s = chunk_duration_seconds
             chunk_start_time = time.monotonic()
+            chunk_deadline = chunk_start_time + chunk_duration_seconds * CHUNK_MAX_WALL_FACTOR
+            self._fire_status()
 
             try:
-                with wave.open(str(output_path), "wb") as wf:
-                    wf.setnchannels(ac["channels"])
-                    wf.setsampwidth(self.audio.get_sample_size(self.get_audio_format()))
-                    wf.setframerate(ac["rate"])
-                    start_time = datetime.now()
+                with _WavChunkWriter(
+                    str(output_path), channels, sampwidth, rate, expected_bytes,
+                ) as wf:
                     consecutive_errors = 0
-
-                    while (datetime.now() - start_time).total_seconds() < chunk_duration_seconds:
+                    chunk_bytes = 0
+                    reads = 0
+                    # Status empurrado à interface a cada segundo de áudio gravado
+                    next_status = bytes_per_second
+                    # PCM acumulado em lotes de 64 KB: um write por lote, sem tocar no cabeçalho
+                    pending = bytearray()
+                    # Referências fixas durante o chunk ficam em variáveis locais; is_monitoring,
+                    # monitor_volume e _stream_manager continuam lidos do self (a UI os altera).
+                    read = self.input_stream.read
+                    wf_write = wf.write
+                    process_chunk = _process_chunk
+                    metrics = self._metrics
+                    monitor_stream = self.monitor_stream
+                    monitor_scratch = self._monitor_scratch
+
+                    # Duração controlada pelos bytes gravados: o WAV fica com o tamanho exato que
+                    # o cabeçalho declara. O relógio só é consultado a cada segundo de áudio e nos
+                    # erros, como teto caso as leituras falhem e os bytes não cheguem ao alvo.
+                    while chunk_bytes < expected_bytes:
                         if not self.is_recording:
                             break
                         try:
-                            data = self.input_stream.read(chunk_size, exception_on_overflow=False)
-                            wf.writeframes(data)
-                            self._metrics.bytes_written += len(data)
+                            data = read(chunk_size, exception_on_overflow=False)
+                            pending += data
+                            if len(pending) >= WAV_WRITE_BATCH_BYTES:
+                                wf_write(pending)
+                                pending.clear()
+                            chunk_bytes += len(data)
+                            metrics.bytes_written = chunk_bytes
                             consecutive_errors = 0
-                            self._update_level(data)
-                            if self._stream_manager:
-                                self._stream_manager.feed_audio(data)
-                            if self.is_monitoring and self.monitor_stream:
-                                scaled = self._scale_audio(data, self.monitor_volume)
-                                self.monitor_stream.write(scaled)
+                            if chunk_bytes >= next_status:
+                                next_status += bytes_per_second
+                                self._fire_status()
+                                if time.monotonic() > chunk_deadline:
+                                    self._log_chunk_deadline()
+                                    break
+                            stream_manager = self._stream_manager
+                            if stream_manager:
+                                stream_manager.feed_audio(data)
+                            # Nível e monitor numa só passada; o monitor recebe bytes (PyAudio.write
+                            # não aceita memoryview)
+                            monitoring = monitor_stream is not None and self.is_monitoring
+                            want_level = not (reads & level_mask)
+                            reads += 1
+                            level, scaled = process_chunk(
+                                data, self.monitor_volume if monitoring else None,
+                                monitor_scratch, want_level,
+                            )
+                            if level is not None:
+                                self.current_level = level
+                            if scaled is not None:
+                                monitor_stream.write(scaled)
                         except (IOError, OSError) as e:
-                            self._metrics.io_errors += 1
+                            metrics.io_errors += 1
                             consecutive_errors += 1
                             self.logger.error(
                                 "Erro de I/O na leitura de áudio (#%d consecutivo): %s",
                                 consecutive_errors, e,
                             )
+                            if time.monotonic() > chunk_deadline:
+                                self._log_chunk_deadline()
+                                break
 
                             if consecutive_errors >= 3:
                                 if self._reopen_input_stream():
                                     consecutive_errors = 0
+                                    read = self.input_stream.read  # stream novo
                                     continue
                                 else:
                                     self.logger.critical(
@@ -539,6 +781,9 @@ class CensuraDigital:
                                     break
                             time.sleep(0.1)
 
+                    if pending:
+                        wf_write(pending)
+
                 self._metrics.actual_duration_s = time.monotonic() - chunk_start_time
 
                 if output_path.exists():
@@ -574,25 +819,11 @@ class CensuraDigital:
 
         self._close_streams()
 
-    def _update_level(self, data: bytes):
-        """Calcula RMS normalizado (0.0-1.0) das amostras PCM int16."""
-        samples = array.array("h", data)
-        if not samples:
-            return
-        sum_sq = sum(s * s for s in samples)
-        rms = math.sqrt(sum_sq / len(samples))
-        self.current_level = min(rms / 32768.0, 1.0)
-
-    @staticmethod
-    def _scale_audio(data: bytes, volume: float) -> bytes:
-        """Escala amostras PCM int16 pelo fator de volume, sem numpy."""
-        if volume == 1.0:
-            return data
-        samples = array.array("h", data)
-        for i in range(len(samples)):
-            val = int(samples[i] * volume)
-            samples[i] = max(-32768, min(32767, val))
-        return samples.tobytes()
+    def _log_chunk_deadline(self):
+        self.logger.warning(
+            "Chunk #%d excedeu %.1fx a duração sem completar os bytes; encerrando e rotacionando.",
+            self.chunk_counter, CHUNK_MAX_WALL_FACTOR,
+        )
 
     def set_stream_manager(self, manager):
         self._stream_manager = manager
@@ -603,6 +834,10 @@ class CensuraDigital:
     def set_recording_failed_callback(self, callback):
         self._recording_failed_callback = callback
 
+    def set_status_callback(self, callback):
+        """Recebe get_status() no início de cada chunk e a cada segundo de áudio gravado."""
+        self._status_callback = callback
+
     def start_recording(self, enable_monitoring: bool = False) -> bool:
         if self.is_recording:
             return False
@@ -611,6 +846,10 @@ class CensuraDigital:
         self.chunk_counter = 0
         self._stall_count = 0
         self._metrics = RecordingMetrics()
+        # Objetos de inicialização (config, PyAudio, UI) saem da varredura do GC durante a gravação;
+        # coleta antes para não congelar ciclos já mortos pela sessão inteira
+        gc.collect()
+        gc.freeze()
         self.recording_thread = threading.Thread(target=self.recording_loop, name="RecordingThread")
         self.recording_thread.daemon = False
         self.recording_thread.start()
@@ -4,9 +4,11 @@ Sistema de Censura Digital - Interface Gráfica v2.1
 Monitor visual com semáforos, VU meter, streaming RTMP/Icecast e autostart.
 """
 
+import bisect
 import json
-import math
 import os
+import queue
+import re
 import subprocess
 import sys
 import tkinter as tk
@@ -25,7 +27,7 @@ WORKER_ICECAST_CMD_FILE = "stream_icecast_cmd.json"
 WORKER_SCRIPT = "recorder_worker.py"
 
 try:
-    from PIL import Image, ImageTk
+    from PIL import Image, ImageDraw, ImageTk
     PIL_AVAILABLE = True
 except ImportError:
     PIL_AVAILABLE = False
@@ -44,7 +46,34 @@ except ImportError:
     CALENDAR_AVAILABLE = False
 
 MAX_LOG_LINES = 1000
+LOG_FLUSH_MS = 50
+LOG_FLUSH_BATCH = 200
+LOG_TRIM_EVERY = 100
 MONITOR_REFRESH_MS = 150
+MONITOR_UNFOCUSED_MS = 500
+MONITOR_HIDDEN_MS = 2000
+VOLUME_DEBOUNCE_MS = 30
+DEVICES_CACHE_TTL_S = 5.0
+ALERT_MAX_CHARS = 80
+_ERR_RE = re.compile(r"erro|encerrou|não encontrado", re.IGNORECASE)
+
+
+# Tabela dBFS em passos de 0,1 dB (-60..0): o nível linear vira índice por bisect, sem log10
+# nem formatação de string a cada atualização do monitor
+_VU_DB_STEPS = [i / 10 for i in range(-600, 1)]
+_VU_LEVEL_BOUNDS = [10 ** ((db + 0.05) / 20) for db in _VU_DB_STEPS[:-1]]  # arredonda ao passo mais próximo
+_VU_LABELS = [f"{db:+.1f} dBFS" for db in _VU_DB_STEPS]
+
+
+def _short_alert(text):
+    """Alertas ficam numa linha só: corta em ALERT_MAX_CHARS em vez de quebrar no Label."""
+    return text if len(text) <= ALERT_MAX_CHARS else text[:ALERT_MAX_CHARS - 3] + "..."
+
+
+def _set_var_if_changed(var, value):
+    """StringVar.set dispara traces e redesenho mesmo sem mudança: só escreve se o valor mudou."""
+    if var.get() != value:
+        var.set(value)
 
 
 # ── Custom widgets ────────────────────────────────────────────────
@@ -53,15 +82,29 @@ MONITOR_REFRESH_MS = 150
 class SemaphoreWidget(ttk.Frame):
     """Indicador circular estilo semáforo (usa composição para compatibilidade Tcl/Tk 9)."""
 
+    # (luz, fundo do halo) já com as cores finais de cada estado
     _PALETTE = {
-        "off":    ("#555555", "#333333"),
+        "off":    ("#555555", "#222222"),
         "red":    ("#FF2222", "#4D0000"),
         "green":  ("#22CC22", "#004D00"),
         "yellow": ("#FFCC00", "#4D3D00"),
     }
 
+    _SUPERSAMPLE = 4
+    _images = {}  # size -> {estado: PhotoImage}, compartilhado entre os semáforos
+
     def __init__(self, parent, size=64):
         super().__init__(parent)
+        self._state = "off"
+        if PIL_AVAILABLE:
+            # Estados pré-renderizados: trocar de estado é só trocar a imagem do Label
+            self._imgs = self._images.get(size)
+            if self._imgs is None:
+                self._imgs = {state: ImageTk.PhotoImage(self._render(state, size)) for state in self._PALETTE}
+                self._images[size] = self._imgs
+            self._lbl = ttk.Label(self, image=self._imgs["off"])
+            self._lbl.pack()
+            return
         self._c = tk.Canvas(self, width=size + 10, height=size + 10, highlightthickness=0)
         self._c.pack()
         pad = 5
@@ -74,15 +117,30 @@ class SemaphoreWidget(ttk.Frame):
             pad + inset, pad + inset, size + pad - inset, size + pad - inset,
             outline="", fill="#555555",
         )
-        self._state = "off"
+
+    @classmethod
+    def _render(cls, state, size):
+        """Desenha o semáforo em RGBA com supersampling (anti-aliasing na redução)."""
+        fill, glow_bg = cls._PALETTE[state]
+        k = cls._SUPERSAMPLE
+        pad, inset = 5 * k, 8 * k
+        full = (size + 10) * k
+        img = Image.new("RGBA", (full, full), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(img)
+        draw.ellipse((pad, pad, size * k + pad, size * k + pad), fill=glow_bg, outline="#666666", width=2 * k)
+        draw.ellipse((pad + inset, pad + inset, size * k + pad - inset, size * k + pad - inset), fill=fill)
+        return img.resize((size + 10, size + 10), Image.LANCZOS)
 
     def set_state(self, state: str):
         if state == self._state:
             return
         self._state = state
-        fill, glow_bg = self._PALETTE.get(state, self._PALETTE["off"])
+        if PIL_AVAILABLE:
+            self._lbl.configure(image=self._imgs.get(state, self._imgs["off"]))
+            return
+        fill, glow_bg = self._PALETTE.get(state) or self._PALETTE["off"]
         self._c.itemconfig(self._light, fill=fill)
-        self._c.itemconfig(self._glow, fill=glow_bg if state != "off" else "#222222")
+        self._c.itemconfig(self._glow, fill=glow_bg)
 
 
 class VUMeterWidget(ttk.Frame):
@@ -101,25 +159,44 @@ class VUMeterWidget(ttk.Frame):
         super().__init__(parent)
         self._bw = bar_width
         self._bh = bar_height
-        self._c = tk.Canvas(self, width=bar_width, height=bar_height, highlightthickness=0, bg="#1a1a1a")
-        self._c.pack()
 
         usable = bar_width - 4
         yellow_x = 2 + int(usable * (-self.DB_FLOOR + self.DB_YELLOW) / -self.DB_FLOOR)
         red_x = 2 + int(usable * (-self.DB_FLOOR + self.DB_RED) / -self.DB_FLOOR)
-
-        self._c.create_rectangle(2, 2, yellow_x, bar_height - 2, outline="", fill="#0a3a0a")
-        self._c.create_rectangle(yellow_x, 2, red_x, bar_height - 2, outline="", fill="#3a3a0a")
-        self._c.create_rectangle(red_x, 2, bar_width - 2, bar_height - 2, outline="", fill="#3a0a0a")
-        self._c.create_rectangle(1, 1, bar_width - 1, bar_height - 1, outline="#444444")
-
-        self._bar = self._c.create_rectangle(2, 2, 2, bar_height - 2, outline="", fill="#22CC22")
-        self._peak_line = self._c.create_line(2, 2, 2, bar_height - 2, fill="#FF8800", width=2, state="hidden")
-
-        for db_mark in [-48, -36, -24, -18, -12, -6, -3, 0]:
-            mx = 2 + int(usable * (db_mark - self.DB_FLOOR) / -self.DB_FLOOR)
-            self._c.create_line(mx, 1, mx, 5, fill="#888888")
-            self._c.create_line(mx, bar_height - 5, mx, bar_height - 1, fill="#888888")
+        marks = [2 + int(usable * (db_mark - self.DB_FLOOR) / -self.DB_FLOOR) for db_mark in (-48, -36, -24, -18, -12, -6, -3, 0)]
+
+        self._bar_color = "#22CC22"
+        self._bar_x = 2
+        self._peak_x = None
+        if PIL_AVAILABLE:
+            # Escala estática numa única imagem; barra e pico são Frames posicionados com place()
+            img = Image.new("RGB", (bar_width, bar_height), "#1a1a1a")
+            draw = ImageDraw.Draw(img)
+            draw.rectangle((2, 2, yellow_x - 1, bar_height - 3), fill="#0a3a0a")
+            draw.rectangle((yellow_x, 2, red_x - 1, bar_height - 3), fill="#3a3a0a")
+            draw.rectangle((red_x, 2, bar_width - 3, bar_height - 3), fill="#3a0a0a")
+            draw.rectangle((1, 1, bar_width - 2, bar_height - 2), outline="#444444")
+            for mx in marks:
+                draw.line((mx, 1, mx, 4), fill="#888888")
+                draw.line((mx, bar_height - 5, mx, bar_height - 2), fill="#888888")
+            self._ladder = ImageTk.PhotoImage(img)
+            self._c = None
+            tk.Label(self, image=self._ladder, borderwidth=0, highlightthickness=0).pack()
+            self._bar_frame = tk.Frame(self, bg=self._bar_color, borderwidth=0, highlightthickness=0)
+            self._peak_frame = tk.Frame(self, bg="#FF8800", borderwidth=0, highlightthickness=0)
+        else:
+            self._bar_frame = self._peak_frame = None
+            self._c = tk.Canvas(self, width=bar_width, height=bar_height, highlightthickness=0, bg="#1a1a1a")
+            self._c.pack()
+            self._c.create_rectangle(2, 2, yellow_x, bar_height - 2, outline="", fill="#0a3a0a")
+            self._c.create_rectangle(yellow_x, 2, red_x, bar_height - 2, outline="", fill="#3a3a0a")
+            self._c.create_rectangle(red_x, 2, bar_width - 2, bar_height - 2, outline="", fill="#3a0a0a")
+            self._c.create_rectangle(1, 1, bar_width - 1, bar_height - 1, outline="#444444")
+            self._bar = self._c.create_rectangle(2, 2, 2, bar_height - 2, outline="", fill=self._bar_color)
+            self._peak_line = self._c.create_line(2, 2, 2, bar_height - 2, fill="#FF8800", width=2, state="hidden")
+            for mx in marks:
+                self._c.create_line(mx, 1, mx, 5, fill="#888888")
+                self._c.create_line(mx, bar_height - 5, mx, bar_height - 1, fill="#888888")
 
         self._target_db = self.DB_FLOOR
         self._display_db = self.DB_FLOOR
@@ -167,7 +244,8 @@ class VUMeterWidget(ttk.Frame):
     def _draw(self):
         db = self._display_db
         frac = (db - self.DB_FLOOR) / -self.DB_FLOOR
-        bar_x = 2 + int(frac * (self._bw - 4))
+        # Passo de 2 px: variações menores são invisíveis e não geram coords()
+        bar_x = (2 + int(frac * (self._bw - 4))) & ~1
 
         if db < self.DB_YELLOW:
             color = "#22CC22"
@@ -176,16 +254,40 @@ class VUMeterWidget(ttk.Frame):
         else:
             color = "#FF2222"
 
-        self._c.coords(self._bar, 2, 2, bar_x, self._bh - 2)
-        self._c.itemconfig(self._bar, fill=color)
+        if bar_x != self._bar_x:
+            self._bar_x = bar_x
+            if self._c is None:
+                if bar_x > 2:
+                    self._bar_frame.place(x=2, y=2, width=bar_x - 2, height=self._bh - 4)
+                else:
+                    self._bar_frame.place_forget()
+            else:
+                self._c.coords(self._bar, 2, 2, bar_x, self._bh - 2)
+        if color != self._bar_color:
+            self._bar_color = color
+            if self._c is None:
+                self._bar_frame.configure(bg=color)
+            else:
+                self._c.itemconfig(self._bar, fill=color)
 
         if self._peak_db > self.DB_FLOOR + 0.3:
             peak_frac = (self._peak_db - self.DB_FLOOR) / -self.DB_FLOOR
             peak_x = 2 + int(peak_frac * (self._bw - 4))
-            self._c.coords(self._peak_line, peak_x, 2, peak_x, self._bh - 2)
-            self._c.itemconfig(self._peak_line, state="normal")
         else:
+            peak_x = None
+        if peak_x == self._peak_x:
+            return
+        self._peak_x = peak_x
+        if self._c is None:
+            if peak_x is None:
+                self._peak_frame.place_forget()
+            else:
+                self._peak_frame.place(x=peak_x - 1, y=2, width=2, height=self._bh - 4)
+        elif peak_x is None:
             self._c.itemconfig(self._peak_line, state="hidden")
+        else:
+            self._c.coords(self._peak_line, peak_x, 2, peak_x, self._bh - 2)
+            self._c.itemconfig(self._peak_line, state="normal")
 
 
 # ── Processor window (unchanged) ─────────────────────────────────
@@ -238,23 +340,64 @@ class ProcessorWindow(tk.Toplevel):
         log_frame.pack(expand=True, fill="both", pady=5)
         self.log_text = scrolledtext.ScrolledText(log_frame, wrap=tk.WORD, state="disabled", height=10)
         self.log_text.pack(expand=True, fill="both")
-
-    def log_message(self, message):
+        # Linhas inseridas desde a última poda; o excesso sobre MAX_LOG_LINES sai em lote
+        self._log_inserts = 0
+        # Threads de processamento só enfileiram; a main thread descarrega em lote, e só
+        # agenda o descarregamento quando há mensagens pendentes
+        self._log_queue = queue.SimpleQueue()
+        self._log_drain_job = None
+        self._drain_scheduled = False
+
+    def _enqueue_log(self, message):
+        self._log_queue.put(message)
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            self._log_drain_job = self.after(LOG_FLUSH_MS, self._drain_log_queue)
+
+    def _drain_log_queue(self):
+        # Libera o flag antes de esvaziar: mensagem que chegar depois agenda novo descarregamento
+        self._drain_scheduled = False
+        self._log_drain_job = None
+        batch = []
+        try:
+            while len(batch) < LOG_FLUSH_BATCH:
+                batch.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if batch:
+            self._append_log(batch)
+        if len(batch) == LOG_FLUSH_BATCH and not self._drain_scheduled:
+            self._drain_scheduled = True
+            self._log_drain_job = self.after(LOG_FLUSH_MS, self._drain_log_queue)
+
+    def _append_log(self, messages):
+        """Insere várias linhas num único ciclo normal/insert/see/disabled."""
+        messages = messages[-MAX_LOG_LINES:]
         try:
             self.log_text.config(state="normal")
-            self.log_text.insert(tk.END, message + "\n")
+            self.log_text.insert(tk.END, "\n".join(messages) + "\n")
+            self._log_inserts += len(messages)
+            if self._log_inserts >= LOG_TRIM_EVERY:
+                self._log_inserts = 0
+                lines = int(self.log_text.index("end-1c").split(".")[0])
+                if lines > MAX_LOG_LINES:
+                    self.log_text.delete("1.0", f"{lines - MAX_LOG_LINES + 1}.0")
             self.log_text.see(tk.END)
             self.log_text.config(state="disabled")
         except tk.TclError:
             pass
 
+    def log_message(self, message):
+        self._append_log([message])
+
     def run_process(self):
         self.log_text.config(state="normal")
         self.log_text.delete(1.0, tk.END)
         self.log_text.config(state="disabled")
+        self._log_inserts = 0
         self.process_btn.config(state="disabled")
         target_date = self.cal.get_date() if CALENDAR_AVAILABLE else self.date_entry.get()
-        callback = lambda msg: self.after(0, self.log_message, msg)
+        callback = self._enqueue_log
         self.processor.run_processing(target_date, self.keep_mp3_var.get(), progress_callback=callback)
         self.after(3000, lambda: self.process_btn.config(state="normal"))
 
@@ -262,10 +405,10 @@ class ProcessorWindow(tk.Toplevel):
         self.process_btn.config(state="disabled")
         self.cut_btn.config(state="disabled")
         start, end = self.cut_start.get().strip(), self.cut_end.get().strip()
-        callback = lambda msg: self.after(0, self.log_message, msg)
+        callback = self._enqueue_log
 
         def done(msg):
-            self.after(0, self.log_message, msg or "Intervalo processado.")
+            self._enqueue_log(msg or "Intervalo processado.")
             self.after(0, lambda: self.process_btn.config(state="normal"))
             self.after(0, lambda: self.cut_btn.config(state="normal"))
 
@@ -280,6 +423,8 @@ class ProcessorWindow(tk.Toplevel):
 
     def on_closing(self):
         self.processor.stop()
+        if self._log_drain_job:
+            self.after_cancel(self._log_drain_job)
         self.destroy()
 
 
@@ -300,13 +445,42 @@ class CensuraDigitalInterface:
         self.processor = None
         self.stream_manager = None
         self._stream_error = False
-        self.audio_devices = []
-        self.status_poller = None
+        # Última mensagem por protocolo aguardando o flush na main thread: {protocolo: (mensagem, houve_erro)}
+        self._pending_status = {}
+        self._pending_status_lock = threading.Lock()
+        # Estado dos streams acompanhado pelos callbacks do StreamManager (sem polling)
+        self._rtmp_active = False
+        self._icecast_active = False
+        # Pares Iniciar/Parar (gravação e streams): estado desejado, aplicado quando a aba existir
+        self._toggle_btns = {}
+        self._toggle_btn_state = {"rec": False, "rtmp": False, "icecast": False}
+        # Dispositivos em listas paralelas (posição = item do combobox)
+        self._dev_indices = []
+        self._dev_in_ch = []
+        self._dev_details = []
+        self._devices_cache = None  # (time.monotonic(), (índices, canais, rótulos, detalhes))
+        self._devices_enumerating = False
+        self._worker_poll_id = None  # after() do poller do arquivo de status do worker
         self._monitor_poller = None
         self._worker_proc = None
         self._last_worker_rtmp_msg = ""
         self._last_worker_ice_msg = ""
         self._cached_worker_data = None
+        self._last_status_msg = None
+        self._vol_after_id = None
+        self._refresh_ms = MONITOR_REFRESH_MS
+        self._next_tick = 0.0
+        self._refresh_check_pending = False
+        self._chunk_start_iso = None
+        self._chunk_start_mono = 0.0
+        self._last_monitor_key = None
+        self._config_cache_bytes = None
+        self._widget_cache = {}  # (widget, opção) -> último valor aplicado pelo monitor
+        self._daily_deadline = None  # epoch da próxima execução diária
+        # Um único worker daemon para o processamento diário: execuções seguidas não disputam o disco
+        # e um job em andamento não segura o processo aberto ao fechar a janela
+        self._proc_queue = queue.SimpleQueue()
+        threading.Thread(target=self._proc_worker_loop, name="proc", daemon=True).start()
 
         # Carregamento direto no mesmo processo (como no censura-digital funcional)
         load_frame = tk.Frame(self.root, bg="#1a1a2e")
@@ -323,6 +497,7 @@ class CensuraDigitalInterface:
             self.censura.set_stream_manager(self.stream_manager)
             self.censura.set_alert_callback(self._on_watchdog_alert)
             self.censura.set_recording_failed_callback(self._on_recording_failed)
+            self.censura.set_status_callback(self._on_recorder_status)
             self.stream_manager.set_status_callback(self._on_stream_status)
         except Exception as e:
             load_frame.destroy()
@@ -330,12 +505,16 @@ class CensuraDigitalInterface:
             self.root.destroy()
             return
         load_frame.destroy()
+        # Seções do config resolvidas uma vez; os dicts são atualizados no lugar, nunca trocados
+        cfg = self.censura.config
+        self._cfg_interface = cfg.setdefault("interface", {})
+        streaming_cfg = cfg.setdefault("streaming", {})
+        self._cfg_rtmp = streaming_cfg.setdefault("rtmp", {})
+        self._cfg_icecast = streaming_cfg.setdefault("icecast", {})
         self.setup_ui()
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
-        self.refresh_devices_list()
         self._start_monitor_loop()
-        autostart = self.censura.config.get("interface", {}).get("autostart_recording", False)
-        if autostart:
+        if self._cfg_interface.get("autostart_recording", False):
             self.root.after(800, self.start_recording)
 
     # ── Dependency error screen ────────────────────────────────
@@ -403,9 +582,15 @@ class CensuraDigitalInterface:
             if platform.system() == "Windows":
                 import tempfile
                 ico_path = Path(tempfile.gettempdir()) / "aleceplay.ico"
-                sizes = [(256, 256), (128, 128), (64, 64), (48, 48), (32, 32), (16, 16)]
-                ico_images = [icon_base.resize(s, Image.LANCZOS) for s in sizes]
-                ico_images[0].save(str(ico_path), format="ICO", sizes=sizes, append_images=ico_images[1:])
+                # O .ico gerado fica no temp: só refaz os 6 redimensionamentos se o PNG for mais novo
+                try:
+                    ico_fresh = ico_path.stat().st_mtime >= logo_path.stat().st_mtime
+                except OSError:
+                    ico_fresh = False
+                if not ico_fresh:
+                    sizes = [(256, 256), (128, 128), (64, 64), (48, 48), (32, 32), (16, 16)]
+                    ico_images = [icon_base.resize(s, Image.LANCZOS) for s in sizes]
+                    ico_images[0].save(str(ico_path), format="ICO", sizes=sizes, append_images=ico_images[1:])
                 self.root.iconbitmap(str(ico_path))
             else:
                 self._icon_imgs = []
@@ -426,6 +611,14 @@ class CensuraDigitalInterface:
     # ── UI Setup ──────────────────────────────────────────────────
 
     def setup_ui(self):
+        # Fontes do Monitor resolvidas uma vez e compartilhadas por estilo
+        style = ttk.Style(self.root)
+        style.configure("StatusBold.TLabel", font=("Arial", 10, "bold"))
+        style.configure("Detail.TLabel", font=("Arial", 9))
+        style.configure("DetailBold.TLabel", font=("Arial", 9, "bold"))
+        style.configure("Metrics.TLabel", font=("Consolas", 8))
+        style.configure("Footer.TLabel", font=("Arial", 8))
+
         notebook = ttk.Notebook(self.root, padding="10")
         notebook.pack(expand=True, fill="both")
 
@@ -440,10 +633,29 @@ class CensuraDigitalInterface:
         notebook.add(tab_config, text=" Configurações ")
 
         self.notebook = notebook
+        self._config_tab = tab_config
+        self._create_recording_vars()
+        self._create_streaming_vars()
         self._create_monitor_tab(tab_monitor)
-        self._create_recording_tab(tab_rec)
-        self._create_streaming_tab(tab_stream)
-        self._create_config_tab(tab_config)
+        # Só o Monitor é montado na partida; as demais abas na primeira vez que forem abertas
+        self._lazy_tabs = {
+            str(tab_rec): lambda: self._create_recording_tab(tab_rec),
+            str(tab_stream): lambda: self._create_streaming_tab(tab_stream),
+            str(tab_config): lambda: self._build_config_tab(tab_config),
+        }
+        self._tab_changed_bind = notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+    def _on_tab_changed(self, event):
+        builder = self._lazy_tabs.pop(self.notebook.select(), None)
+        if builder is not None:
+            builder()
+        if not self._lazy_tabs:
+            # Todas as abas montadas: trocas de aba não precisam mais passar pelo Python
+            self.notebook.unbind("<<NotebookTabChanged>>", self._tab_changed_bind)
+
+    def _build_config_tab(self, parent):
+        self._create_config_tab(parent)
+        self.refresh_devices_list()
 
     # ── Monitor tab ───────────────────────────────────────────────
 
@@ -479,9 +691,9 @@ class CensuraDigitalInterface:
         rec_card.grid(row=0, column=0, padx=5, sticky="nsew")
         self.rec_semaphore = SemaphoreWidget(rec_card, size=64)
         self.rec_semaphore.pack(pady=(5, 8))
-        self.rec_card_status = ttk.Label(rec_card, text="INATIVO", anchor="center", font=("Arial", 10, "bold"))
+        self.rec_card_status = ttk.Label(rec_card, text="INATIVO", anchor="center", style="StatusBold.TLabel")
         self.rec_card_status.pack()
-        self.rec_card_detail = ttk.Label(rec_card, text="--", anchor="center", font=("Arial", 9))
+        self.rec_card_detail = ttk.Label(rec_card, text="--", anchor="center", style="Detail.TLabel")
         self.rec_card_detail.pack(pady=(2, 0))
         rec_btn_f = ttk.Frame(rec_card)
         rec_btn_f.pack(pady=(6, 0), fill="x")
@@ -495,9 +707,9 @@ class CensuraDigitalInterface:
         rtmp_card.grid(row=0, column=1, padx=5, sticky="nsew")
         self.rtmp_semaphore = SemaphoreWidget(rtmp_card, size=64)
         self.rtmp_semaphore.pack(pady=(5, 8))
-        self.rtmp_card_status = ttk.Label(rtmp_card, text="INATIVO", anchor="center", font=("Arial", 10, "bold"))
+        self.rtmp_card_status = ttk.Label(rtmp_card, text="INATIVO", anchor="center", style="StatusBold.TLabel")
         self.rtmp_card_status.pack()
-        self.rtmp_card_detail = ttk.Label(rtmp_card, text="--", anchor="center", font=("Arial", 9))
+        self.rtmp_card_detail = ttk.Label(rtmp_card, text="--", anchor="center", style="Detail.TLabel")
         self.rtmp_card_detail.pack(pady=(2, 0))
         rtmp_btn_f = ttk.Frame(rtmp_card)
         rtmp_btn_f.pack(pady=(6, 0), fill="x")
@@ -511,9 +723,9 @@ class CensuraDigitalInterface:
         ice_card.grid(row=0, column=2, padx=5, sticky="nsew")
         self.ice_semaphore = SemaphoreWidget(ice_card, size=64)
         self.ice_semaphore.pack(pady=(5, 8))
-        self.ice_card_status = ttk.Label(ice_card, text="INATIVO", anchor="center", font=("Arial", 10, "bold"))
+        self.ice_card_status = ttk.Label(ice_card, text="INATIVO", anchor="center", style="StatusBold.TLabel")
         self.ice_card_status.pack()
-        self.ice_card_detail = ttk.Label(ice_card, text="--", anchor="center", font=("Arial", 9))
+        self.ice_card_detail = ttk.Label(ice_card, text="--", anchor="center", style="Detail.TLabel")
         self.ice_card_detail.pack(pady=(2, 0))
         ice_btn_f = ttk.Frame(ice_card)
         ice_btn_f.pack(pady=(6, 0), fill="x")
@@ -529,32 +741,32 @@ class CensuraDigitalInterface:
 
         rtmp_m = ttk.Frame(metrics_frame)
         rtmp_m.grid(row=0, column=0, padx=5, sticky="nsew")
-        ttk.Label(rtmp_m, text="RTMP", font=("Arial", 9, "bold")).pack(anchor="w")
+        ttk.Label(rtmp_m, text="RTMP", style="DetailBold.TLabel").pack(anchor="w")
         self.rtmp_metrics_var = tk.StringVar(value="--")
-        ttk.Label(rtmp_m, textvariable=self.rtmp_metrics_var, font=("Consolas", 8), justify=tk.LEFT).pack(anchor="w")
+        ttk.Label(rtmp_m, textvariable=self.rtmp_metrics_var, style="Metrics.TLabel", justify=tk.LEFT).pack(anchor="w")
 
         ice_m = ttk.Frame(metrics_frame)
         ice_m.grid(row=0, column=1, padx=5, sticky="nsew")
-        ttk.Label(ice_m, text="Icecast", font=("Arial", 9, "bold")).pack(anchor="w")
+        ttk.Label(ice_m, text="Icecast", style="DetailBold.TLabel").pack(anchor="w")
         self.ice_metrics_var = tk.StringVar(value="--")
-        ttk.Label(ice_m, textvariable=self.ice_metrics_var, font=("Consolas", 8), justify=tk.LEFT).pack(anchor="w")
+        ttk.Label(ice_m, textvariable=self.ice_metrics_var, style="Metrics.TLabel", justify=tk.LEFT).pack(anchor="w")
 
         # Quality bar (RTMP)
         qbar_frame = ttk.Frame(metrics_frame)
         qbar_frame.grid(row=1, column=0, columnspan=2, padx=5, pady=(4, 0), sticky="ew")
-        ttk.Label(qbar_frame, text="Qualidade:", font=("Arial", 8)).pack(side="left")
+        ttk.Label(qbar_frame, text="Qualidade:", style="Footer.TLabel").pack(side="left")
         self._quality_canvas = tk.Canvas(qbar_frame, width=200, height=12, highlightthickness=0, bg="#1a1a1a")
         self._quality_canvas.pack(side="left", padx=5)
         self._quality_bar = self._quality_canvas.create_rectangle(1, 1, 1, 11, outline="", fill="#22CC22")
         self._quality_canvas.create_rectangle(0, 0, 200, 12, outline="#444444")
-        self.quality_label = ttk.Label(qbar_frame, text="--", font=("Arial", 8), width=8)
+        self.quality_label = ttk.Label(qbar_frame, text="--", style="Footer.TLabel", width=8)
         self.quality_label.pack(side="left")
 
         # Autostart checkbox
         auto_frame = ttk.Frame(frame)
         auto_frame.pack(fill="x", pady=(8, 3))
         self.autostart_var = tk.BooleanVar(
-            value=self.censura.config.get("interface", {}).get("autostart_recording", False)
+            value=self._cfg_interface.get("autostart_recording", False)
         )
         ttk.Checkbutton(
             auto_frame,
@@ -567,24 +779,96 @@ class CensuraDigitalInterface:
         alert_frame = ttk.LabelFrame(frame, text="Alertas", padding="5")
         alert_frame.pack(fill="x", pady=(5, 0))
         self.alert_var = tk.StringVar(value="Nenhum alerta")
-        ttk.Label(alert_frame, textvariable=self.alert_var, wraplength=550).pack(fill="x")
+        ttk.Label(alert_frame, textvariable=self.alert_var).pack(fill="x")
 
-        ttk.Label(frame, text="Alece Play  |  Desenvolvido por Rodrigo Lima", font=("Arial", 8)).pack(side="bottom", pady=3)
+        ttk.Label(frame, text="Alece Play  |  Desenvolvido por Rodrigo Lima", style="Footer.TLabel").pack(side="bottom", pady=3)
 
     def _save_autostart(self):
-        if "interface" not in self.censura.config:
-            self.censura.config["interface"] = {}
-        self.censura.config["interface"]["autostart_recording"] = self.autostart_var.get()
+        self._cfg_interface["autostart_recording"] = self.autostart_var.get()
         try:
-            self.censura.save_config()
+            self._save_config_if_changed()
         except Exception:
             pass
 
+    def _save_config_if_changed(self):
+        """Grava o config só se o conteúdo mudou desde a última gravação bem-sucedida. Retorna True se gravou.
+
+        O cache guarda também o mtime do arquivo: edição ou remoção fora do programa força nova gravação.
+        Falha na gravação levanta OSError e não atualiza o cache.
+        """
+        data = json.dumps(self.censura.config, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        try:
+            mtime = os.stat(self.censura.config_file).st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime is not None and (data, mtime) == self._config_cache_bytes:
+            return False
+        if not self.censura.save_config():
+            raise OSError(f"não foi possível gravar {self.censura.config_file}")
+        try:
+            self._config_cache_bytes = (data, os.stat(self.censura.config_file).st_mtime_ns)
+        except OSError:
+            self._config_cache_bytes = None
+        return True
+
     # ── Monitor update loop ───────────────────────────────────────
 
     def _start_monitor_loop(self):
+        # Janela minimizada ou sem foco não precisa de 6-7 redesenhos por segundo
+        for seq in ("<Map>", "<Unmap>", "<FocusIn>", "<FocusOut>"):
+            self.root.bind(seq, self._on_visibility_event, add="+")
+        self._next_tick = time.monotonic()
         self._update_monitor()
 
+    def _chunk_elapsed_s(self, chunk_start_iso):
+        """Segundos inteiros desde o início do chunk; o ISO só é convertido quando o chunk muda."""
+        if chunk_start_iso != self._chunk_start_iso:
+            start_time = datetime.fromisoformat(chunk_start_iso)
+            self._chunk_start_iso = chunk_start_iso
+            self._chunk_start_mono = time.monotonic() - (datetime.now() - start_time).total_seconds()
+        return int(time.monotonic() - self._chunk_start_mono)
+
+    def _schedule_monitor_tick(self):
+        """Agenda o próximo tick por prazo absoluto: o custo do tick não alonga o período."""
+        period = self._refresh_ms / 1000
+        now = time.monotonic()
+        self._next_tick += period
+        if self._next_tick <= now:
+            # Atrasou um período inteiro (tick lento, sistema ocupado): ressincroniza sem rajada
+            self._next_tick = now + period
+        self._monitor_poller = self.root.after(max(1, int((self._next_tick - now) * 1000)), self._update_monitor)
+
+    def _on_visibility_event(self, event):
+        # Os eventos chegam também dos widgets filhos: consolida e avalia uma vez no idle
+        if not self._refresh_check_pending:
+            self._refresh_check_pending = True
+            self.root.after_idle(self._update_refresh_rate)
+
+    def _update_refresh_rate(self):
+        self._refresh_check_pending = False
+        try:
+            if self.root.state() == "iconic":
+                refresh_ms = MONITOR_HIDDEN_MS
+            elif self.root.focus_displayof() is None:
+                refresh_ms = MONITOR_UNFOCUSED_MS
+            else:
+                refresh_ms = MONITOR_REFRESH_MS
+        except (tk.TclError, KeyError):
+            refresh_ms = MONITOR_REFRESH_MS
+        previous, self._refresh_ms = self._refresh_ms, refresh_ms
+        if refresh_ms < previous and self._monitor_poller:
+            # Voltou a ficar visível: não espera o fim do intervalo longo
+            self.root.after_cancel(self._monitor_poller)
+            self._next_tick = time.monotonic() + refresh_ms / 1000
+            self._monitor_poller = self.root.after(refresh_ms, self._update_monitor)
+
+    def _config_if_changed(self, widget, option, value):
+        """configure() é uma ida ao Tcl: só chama quando o valor difere do último aplicado."""
+        key = (widget, option)
+        if self._widget_cache.get(key) != value:
+            self._widget_cache[key] = value
+            widget.configure(**{option: value})
+
     def _apply_worker_data(self, status, stream_st, wd):
         """Mescla dados do worker no status/stream_st local."""
         status = {
@@ -632,40 +916,51 @@ class CensuraDigitalInterface:
                 setattr(self, attr, msg)
                 if msg != "Inativo" and any(kw in msg.lower() for kw in self._ALERT_KEYWORDS):
                     ts = time.strftime('%H:%M:%S')
-                    self.alert_var.set(f"[{ts}] {proto}: {msg}")
+                    _set_var_if_changed(self.alert_var, _short_alert(f"[{ts}] {proto}: {msg}"))
 
         is_rec = status["is_recording"]
         stalls = status.get("stall_count", 0)
 
+        # Tick idêntico ao anterior (mesmo estado, nível, métricas e segundo do chunk): nada a redesenhar
+        snapshot = (
+            is_rec, stalls, status.get("chunk_counter"), status.get("current_chunk_start"),
+            round(status.get("current_level", 0.0), 3),
+            stream_st.get("rtmp_active"), stream_st.get("icecast_active"), self._stream_error,
+            stream_st.get("rtmp_metrics"), stream_st.get("icecast_metrics"),
+            int(time.monotonic() - self._chunk_start_mono) if is_rec else 0,
+        )
+        if snapshot == self._last_monitor_key:
+            self._schedule_monitor_tick()
+            return
+        self._last_monitor_key = snapshot
+
         # VU meter (escala dBFS logarítmica)
         level = status.get("current_level", 0.0) if is_rec else 0.0
         if is_rec and level > 0:
-            db = 20 * math.log10(max(level, 1e-10))
-            db = max(-60.0, db)
-            self.vu_meter.set_db(db)
-            self.vu_label.config(text=f"{db:+.1f} dBFS")
+            idx = bisect.bisect_right(_VU_LEVEL_BOUNDS, level)
+            self.vu_meter.set_db(_VU_DB_STEPS[idx])
+            self._config_if_changed(self.vu_label, "text", _VU_LABELS[idx])
         else:
             self.vu_meter.set_db(-60.0)
-            self.vu_label.config(text="--- dBFS")
+            self._config_if_changed(self.vu_label, "text", "--- dBFS")
 
         # Recording semaphore
         if is_rec and stalls == 0:
             self.rec_semaphore.set_state("red")
-            self.rec_card_status.config(text="GRAVANDO")
+            self._config_if_changed(self.rec_card_status, "text", "GRAVANDO")
         elif is_rec and stalls > 0:
             self.rec_semaphore.set_state("yellow")
-            self.rec_card_status.config(text="ALERTA")
+            self._config_if_changed(self.rec_card_status, "text", "ALERTA")
         else:
             self.rec_semaphore.set_state("off")
-            self.rec_card_status.config(text="INATIVO")
+            self._config_if_changed(self.rec_card_status, "text", "INATIVO")
 
-        if is_rec and status.get("current_chunk_start"):
-            start_time = datetime.fromisoformat(status["current_chunk_start"])
-            elapsed = datetime.now() - start_time
-            mins, secs = divmod(int(elapsed.total_seconds()), 60)
-            self.rec_card_detail.config(text=f"Chunk #{status['chunk_counter']}  {mins:02d}:{secs:02d}")
+        chunk_start_iso = status.get("current_chunk_start") if is_rec else None
+        if chunk_start_iso:
+            mins, secs = divmod(self._chunk_elapsed_s(chunk_start_iso), 60)
+            self._config_if_changed(self.rec_card_detail, "text", f"Chunk #{status['chunk_counter']}  {mins:02d}:{secs:02d}")
         else:
-            self.rec_card_detail.config(text="--")
+            self._config_if_changed(self.rec_card_detail, "text", "--")
 
         # RTMP semaphore
         rtmp_active = stream_st.get("rtmp_active", False)
@@ -674,26 +969,24 @@ class CensuraDigitalInterface:
             rtmp_connected = rtmp_m.get("connected", False)
             if rtmp_connected:
                 self.rtmp_semaphore.set_state("red")
-                self.rtmp_card_status.config(text="ON AIR")
-                self.rtmp_card_detail.config(
-                    text=f"{rtmp_m.get('target_bitrate_kbps', 0)} kbps"
-                )
+                self._config_if_changed(self.rtmp_card_status, "text", "ON AIR")
+                self._config_if_changed(self.rtmp_card_detail, "text", f"{rtmp_m.get('target_bitrate_kbps', 0)} kbps")
             else:
                 self.rtmp_semaphore.set_state("yellow")
-                self.rtmp_card_status.config(text="CONECTANDO")
-                self.rtmp_card_detail.config(text="Aguardando servidor...")
+                self._config_if_changed(self.rtmp_card_status, "text", "CONECTANDO")
+                self._config_if_changed(self.rtmp_card_detail, "text", "Aguardando servidor...")
         elif self._stream_error:
             self.rtmp_semaphore.set_state("yellow")
-            self.rtmp_card_status.config(text="ERRO")
-            self.rtmp_card_detail.config(text=rtmp_m.get("last_error", "")[:30])
+            self._config_if_changed(self.rtmp_card_status, "text", "ERRO")
+            self._config_if_changed(self.rtmp_card_detail, "text", rtmp_m.get("last_error", "")[:30])
         elif is_rec:
             self.rtmp_semaphore.set_state("green")
-            self.rtmp_card_status.config(text="PRONTO")
-            self.rtmp_card_detail.config(text="Gravação ativa")
+            self._config_if_changed(self.rtmp_card_status, "text", "PRONTO")
+            self._config_if_changed(self.rtmp_card_detail, "text", "Gravação ativa")
         else:
             self.rtmp_semaphore.set_state("off")
-            self.rtmp_card_status.config(text="INATIVO")
-            self.rtmp_card_detail.config(text="--")
+            self._config_if_changed(self.rtmp_card_status, "text", "INATIVO")
+            self._config_if_changed(self.rtmp_card_detail, "text", "--")
 
         # Icecast semaphore
         ice_active = stream_st.get("icecast_active", False)
@@ -702,39 +995,37 @@ class CensuraDigitalInterface:
             ice_connected = ice_m.get("connected", False)
             if ice_connected:
                 self.ice_semaphore.set_state("red")
-                self.ice_card_status.config(text="ON AIR")
-                self.ice_card_detail.config(
-                    text=f"{ice_m.get('target_bitrate_kbps', 0)} kbps"
-                )
+                self._config_if_changed(self.ice_card_status, "text", "ON AIR")
+                self._config_if_changed(self.ice_card_detail, "text", f"{ice_m.get('target_bitrate_kbps', 0)} kbps")
             else:
                 self.ice_semaphore.set_state("yellow")
-                self.ice_card_status.config(text="CONECTANDO")
-                self.ice_card_detail.config(text="Aguardando servidor...")
+                self._config_if_changed(self.ice_card_status, "text", "CONECTANDO")
+                self._config_if_changed(self.ice_card_detail, "text", "Aguardando servidor...")
         elif self._stream_error:
             self.ice_semaphore.set_state("yellow")
-            self.ice_card_status.config(text="ERRO")
-            self.ice_card_detail.config(text=ice_m.get("last_error", "")[:30])
+            self._config_if_changed(self.ice_card_status, "text", "ERRO")
+            self._config_if_changed(self.ice_card_detail, "text", ice_m.get("last_error", "")[:30])
         elif is_rec:
             self.ice_semaphore.set_state("green")
-            self.ice_card_status.config(text="PRONTO")
-            self.ice_card_detail.config(text="Gravação ativa")
+            self._config_if_changed(self.ice_card_status, "text", "PRONTO")
+            self._config_if_changed(self.ice_card_detail, "text", "Gravação ativa")
         else:
             self.ice_semaphore.set_state("off")
-            self.ice_card_status.config(text="INATIVO")
-            self.ice_card_detail.config(text="--")
+            self._config_if_changed(self.ice_card_status, "text", "INATIVO")
+            self._config_if_changed(self.ice_card_detail, "text", "--")
 
         # Streaming metrics panel
         self._update_metrics_display(rtmp_active, rtmp_m, ice_active, ice_m)
 
         # Sync monitor tab buttons
-        self.mon_rec_start.config(state="disabled" if is_rec else "normal")
-        self.mon_rec_stop.config(state="normal" if is_rec else "disabled")
-        self.mon_rtmp_start.config(state="normal" if (is_rec and not rtmp_active) else "disabled")
-        self.mon_rtmp_stop.config(state="normal" if rtmp_active else "disabled")
-        self.mon_ice_start.config(state="normal" if (is_rec and not ice_active) else "disabled")
-        self.mon_ice_stop.config(state="normal" if ice_active else "disabled")
+        self._config_if_changed(self.mon_rec_start, "state", "disabled" if is_rec else "normal")
+        self._config_if_changed(self.mon_rec_stop, "state", "normal" if is_rec else "disabled")
+        self._config_if_changed(self.mon_rtmp_start, "state", "normal" if (is_rec and not rtmp_active) else "disabled")
+        self._config_if_changed(self.mon_rtmp_stop, "state", "normal" if rtmp_active else "disabled")
+        self._config_if_changed(self.mon_ice_start, "state", "normal" if (is_rec and not ice_active) else "disabled")
+        self._config_if_changed(self.mon_ice_stop, "state", "normal" if ice_active else "disabled")
 
-        self._monitor_poller = self.root.after(MONITOR_REFRESH_MS, self._update_monitor)
+        self._schedule_monitor_tick()
 
     def _format_metrics(self, m: dict, active: bool) -> str:
         if not active or not m:
@@ -768,8 +1059,8 @@ class CensuraDigitalInterface:
         )
 
     def _update_metrics_display(self, rtmp_active, rtmp_m, ice_active, ice_m):
-        self.rtmp_metrics_var.set(self._format_metrics(rtmp_m, rtmp_active))
-        self.ice_metrics_var.set(self._format_metrics(ice_m, ice_active))
+        _set_var_if_changed(self.rtmp_metrics_var, self._format_metrics(rtmp_m, rtmp_active))
+        _set_var_if_changed(self.ice_metrics_var, self._format_metrics(ice_m, ice_active))
 
         best_quality = 1.0
         any_stream = False
@@ -791,13 +1082,21 @@ class CensuraDigitalInterface:
                 color = "#FF2222"
             self._quality_canvas.coords(self._quality_bar, 1, 1, bar_x, 11)
             self._quality_canvas.itemconfig(self._quality_bar, fill=color)
-            self.quality_label.config(text=f"{best_quality * 100:.1f}%")
+            self._config_if_changed(self.quality_label, "text", f"{best_quality * 100:.1f}%")
         else:
             self._quality_canvas.coords(self._quality_bar, 1, 1, 1, 11)
-            self.quality_label.config(text="--")
+            self._config_if_changed(self.quality_label, "text", "--")
 
     # ── Recording tab ─────────────────────────────────────────────
 
+    def _create_recording_vars(self):
+        """Variáveis da aba Gravação: usadas pelos controles e callbacks antes de a aba existir."""
+        self.status_var = tk.StringVar(value="Pronto para iniciar")
+        self.monitor_var = tk.BooleanVar()
+        self.volume_var = tk.DoubleVar(value=1.0)
+        self.health_var = tk.StringVar(value="--")
+        self.volume_slider = None
+
     def _create_recording_tab(self, parent):
         frame = ttk.Frame(parent, padding="15")
         frame.pack(expand=True, fill="both")
@@ -806,19 +1105,18 @@ class CensuraDigitalInterface:
 
         control_frame = ttk.LabelFrame(frame, text="Controle de Gravação", padding="10")
         control_frame.pack(fill="x", pady=5)
-        self.status_var = tk.StringVar(value="Pronto para iniciar")
-        ttk.Label(control_frame, textvariable=self.status_var, wraplength=450, justify=tk.CENTER).grid(row=0, column=0, columnspan=2, pady=10)
+        ttk.Label(control_frame, textvariable=self.status_var, justify=tk.CENTER).grid(row=0, column=0, columnspan=2, pady=10)
         self.start_btn = ttk.Button(control_frame, text="Iniciar Gravação", command=self.start_recording)
         self.start_btn.grid(row=1, column=0, padx=5, pady=5, sticky="ew")
         self.stop_btn = ttk.Button(control_frame, text="Parar Gravação", command=self.stop_recording, state="disabled")
         self.stop_btn.grid(row=1, column=1, padx=5, pady=5, sticky="ew")
+        self._toggle_btns["rec"] = (self.start_btn, self.stop_btn)
+        self._set_toggle_buttons("rec", self._toggle_btn_state["rec"])
         control_frame.columnconfigure((0, 1), weight=1)
 
         monitor_frame = ttk.LabelFrame(frame, text="Monitor de Áudio", padding="10")
         monitor_frame.pack(fill="x", pady=10)
-        self.monitor_var = tk.BooleanVar()
         ttk.Checkbutton(monitor_frame, text="Ouvir o que está sendo gravado", variable=self.monitor_var, command=self.toggle_monitoring).grid(row=0, column=0, columnspan=2, sticky="w")
-        self.volume_var = tk.DoubleVar(value=1.0)
         ttk.Label(monitor_frame, text="Volume:").grid(row=1, column=0, pady=10, sticky="w")
         self.volume_slider = ttk.Scale(monitor_frame, from_=0.0, to=1.5, orient=tk.HORIZONTAL, variable=self.volume_var, command=self.set_volume)
         self.volume_slider.grid(row=1, column=1, pady=10, sticky="ew")
@@ -826,13 +1124,30 @@ class CensuraDigitalInterface:
 
         health_frame = ttk.LabelFrame(frame, text="Saúde da Gravação", padding="10")
         health_frame.pack(fill="x", pady=5)
-        self.health_var = tk.StringVar(value="--")
-        ttk.Label(health_frame, textvariable=self.health_var, wraplength=450).pack(fill="x")
+        ttk.Label(health_frame, textvariable=self.health_var).pack(fill="x")
 
         self.toggle_monitoring()
 
     # ── Streaming tab ─────────────────────────────────────────────
 
+    def _create_streaming_vars(self):
+        """Variáveis do streaming existem desde o início: o Monitor e os callbacks as usam
+        mesmo antes de a aba ser construída."""
+        rtmp_cfg = self._cfg_rtmp
+        self.rtmp_url_var = tk.StringVar(value=rtmp_cfg.get("url", ""))
+        self.rtmp_bitrate_var = tk.IntVar(value=rtmp_cfg.get("audio_bitrate_kbps", 128))
+        self.rtmp_status_var = tk.StringVar(value="Inativo")
+        self.rtmp_autostart_var = tk.BooleanVar(value=rtmp_cfg.get("enabled", False))
+        ice_cfg = self._cfg_icecast
+        self.ice_host_var = tk.StringVar(value=ice_cfg.get("host", "localhost"))
+        self.ice_port_var = tk.IntVar(value=ice_cfg.get("port", 8000))
+        self.ice_mount_var = tk.StringVar(value=ice_cfg.get("mount", "/live"))
+        self.ice_pass_var = tk.StringVar(value=ice_cfg.get("source_password", ""))
+        self.ice_bitrate_var = tk.IntVar(value=ice_cfg.get("audio_bitrate_kbps", 128))
+        self.ice_status_var = tk.StringVar(value="Inativo")
+        self.ice_autostart_var = tk.BooleanVar(value=ice_cfg.get("enabled", False))
+        self._proto_status_vars = {"rtmp": self.rtmp_status_var, "icecast": self.ice_status_var}
+
     def _create_streaming_tab(self, parent):
         frame = ttk.Frame(parent, padding="15")
         frame.pack(expand=True, fill="both")
@@ -841,13 +1156,9 @@ class CensuraDigitalInterface:
         rtmp_frame = ttk.LabelFrame(frame, text="RTMP (YouTube/Facebook/Genérico)", padding="10")
         rtmp_frame.pack(fill="x", pady=5)
         ttk.Label(rtmp_frame, text="URL RTMP:").grid(row=0, column=0, sticky="w", pady=2)
-        rtmp_cfg = self.censura.config.get("streaming", {}).get("rtmp", {})
-        self.rtmp_url_var = tk.StringVar(value=rtmp_cfg.get("url", ""))
         ttk.Entry(rtmp_frame, textvariable=self.rtmp_url_var, width=50).grid(row=0, column=1, columnspan=2, sticky="ew", padx=5)
         ttk.Label(rtmp_frame, text="Bitrate (kbps):").grid(row=1, column=0, sticky="w", pady=2)
-        self.rtmp_bitrate_var = tk.IntVar(value=rtmp_cfg.get("audio_bitrate_kbps", 128))
         ttk.Spinbox(rtmp_frame, from_=64, to=320, textvariable=self.rtmp_bitrate_var, width=8).grid(row=1, column=1, sticky="w", padx=5)
-        self.rtmp_status_var = tk.StringVar(value="Inativo")
         ttk.Label(rtmp_frame, text="Status:").grid(row=2, column=0, sticky="w", pady=2)
         ttk.Label(rtmp_frame, textvariable=self.rtmp_status_var).grid(row=2, column=1, columnspan=2, sticky="w", padx=5)
         btn_rtmp = ttk.Frame(rtmp_frame)
@@ -856,30 +1167,22 @@ class CensuraDigitalInterface:
         self.rtmp_start_btn.pack(side="left", padx=5, expand=True, fill="x")
         self.rtmp_stop_btn = ttk.Button(btn_rtmp, text="Parar RTMP", command=self.stop_rtmp, state="disabled")
         self.rtmp_stop_btn.pack(side="left", padx=5, expand=True, fill="x")
-        self.rtmp_autostart_var = tk.BooleanVar(value=rtmp_cfg.get("enabled", False))
         ttk.Checkbutton(rtmp_frame, text="Iniciar automaticamente com a gravação", variable=self.rtmp_autostart_var).grid(row=4, column=0, columnspan=3, sticky="w", pady=(2, 0))
         rtmp_frame.columnconfigure(1, weight=1)
 
         # Icecast
         ice_frame = ttk.LabelFrame(frame, text="Icecast (Rádio Internet)", padding="10")
         ice_frame.pack(fill="x", pady=10)
-        ice_cfg = self.censura.config.get("streaming", {}).get("icecast", {})
         ttk.Label(ice_frame, text="Host:").grid(row=0, column=0, sticky="w", pady=2)
-        self.ice_host_var = tk.StringVar(value=ice_cfg.get("host", "localhost"))
         ttk.Entry(ice_frame, textvariable=self.ice_host_var, width=25).grid(row=0, column=1, sticky="ew", padx=5)
         ttk.Label(ice_frame, text="Porta:").grid(row=0, column=2, sticky="w", padx=(10, 0))
-        self.ice_port_var = tk.IntVar(value=ice_cfg.get("port", 8000))
         ttk.Spinbox(ice_frame, from_=1, to=65535, textvariable=self.ice_port_var, width=7).grid(row=0, column=3, sticky="w", padx=5)
         ttk.Label(ice_frame, text="Mount:").grid(row=1, column=0, sticky="w", pady=2)
-        self.ice_mount_var = tk.StringVar(value=ice_cfg.get("mount", "/live"))
         ttk.Entry(ice_frame, textvariable=self.ice_mount_var, width=20).grid(row=1, column=1, sticky="ew", padx=5)
         ttk.Label(ice_frame, text="Senha:").grid(row=1, column=2, sticky="w", padx=(10, 0))
-        self.ice_pass_var = tk.StringVar(value=ice_cfg.get("source_password", ""))
         ttk.Entry(ice_frame, textvariable=self.ice_pass_var, show="*", width=15).grid(row=1, column=3, sticky="ew", padx=5)
         ttk.Label(ice_frame, text="Bitrate (kbps):").grid(row=2, column=0, sticky="w", pady=2)
-        self.ice_bitrate_var = tk.IntVar(value=ice_cfg.get("audio_bitrate_kbps", 128))
         ttk.Spinbox(ice_frame, from_=64, to=320, textvariable=self.ice_bitrate_var, width=8).grid(row=2, column=1, sticky="w", padx=5)
-        self.ice_status_var = tk.StringVar(value="Inativo")
         ttk.Label(ice_frame, text="Status:").grid(row=3, column=0, sticky="w", pady=2)
         ttk.Label(ice_frame, textvariable=self.ice_status_var).grid(row=3, column=1, columnspan=3, sticky="w", padx=5)
         btn_ice = ttk.Frame(ice_frame)
@@ -888,13 +1191,18 @@ class CensuraDigitalInterface:
         self.ice_start_btn.pack(side="left", padx=5, expand=True, fill="x")
         self.ice_stop_btn = ttk.Button(btn_ice, text="Parar Icecast", command=self.stop_icecast, state="disabled")
         self.ice_stop_btn.pack(side="left", padx=5, expand=True, fill="x")
-        self.ice_autostart_var = tk.BooleanVar(value=ice_cfg.get("enabled", False))
         ttk.Checkbutton(ice_frame, text="Iniciar automaticamente com a gravação", variable=self.ice_autostart_var).grid(row=5, column=0, columnspan=4, sticky="w", pady=(2, 0))
         ice_frame.columnconfigure(1, weight=1)
         ice_frame.columnconfigure(3, weight=1)
 
         ttk.Button(frame, text="Salvar Configurações de Streaming", command=self.save_streaming_config).pack(fill="x", pady=10)
 
+        # Aplica o estado que os callbacks registraram antes de a aba existir
+        self._toggle_btns["rtmp"] = (self.rtmp_start_btn, self.rtmp_stop_btn)
+        self._toggle_btns["icecast"] = (self.ice_start_btn, self.ice_stop_btn)
+        self._set_toggle_buttons("rtmp", self._toggle_btn_state["rtmp"])
+        self._set_toggle_buttons("icecast", self._toggle_btn_state["icecast"])
+
     # ── Config tab ────────────────────────────────────────────────
 
     def _create_config_tab(self, parent):
@@ -907,7 +1215,7 @@ class CensuraDigitalInterface:
         self.device_combo = ttk.Combobox(device_frame, textvariable=self.device_var, state="readonly", width=50)
         self.device_combo.grid(row=0, column=0, sticky="ew", pady=5)
         self.device_combo.bind("<<ComboboxSelected>>", self.on_device_select)
-        ttk.Button(device_frame, text="Atualizar", command=self.refresh_devices_list).grid(row=0, column=1, padx=10)
+        ttk.Button(device_frame, text="Atualizar", command=lambda: self.refresh_devices_list(force=True)).grid(row=0, column=1, padx=10)
         self.device_details_var = tk.StringVar(value="Selecione um dispositivo para ver os detalhes.")
         ttk.Label(device_frame, textvariable=self.device_details_var, wraplength=450, justify=tk.LEFT).grid(row=1, column=0, columnspan=2, pady=5, sticky="w")
         device_frame.columnconfigure(0, weight=1)
@@ -923,6 +1231,15 @@ class CensuraDigitalInterface:
 
     # ── Streaming controls ────────────────────────────────────────
 
+    def _set_toggle_buttons(self, key, active):
+        """Habilita Iniciar ou Parar do par `key`; active=None desabilita ambos (parada em curso)."""
+        self._toggle_btn_state[key] = active
+        btns = self._toggle_btns.get(key)
+        if btns:
+            start_btn, stop_btn = btns
+            self._config_if_changed(start_btn, "state", "normal" if active is False else "disabled")
+            self._config_if_changed(stop_btn, "state", "normal" if active else "disabled")
+
     def _is_recording_active(self):
         if USE_WORKER_RECORDING and self._worker_proc is not None:
             return True
@@ -939,27 +1256,24 @@ class CensuraDigitalInterface:
             try:
                 with open(WORKER_RTMP_CMD_FILE, "w", encoding="utf-8") as f:
                     json.dump({"action": "start", "url": url, "bitrate": bitrate}, f)
-                self.rtmp_start_btn.config(state="disabled")
-                self.rtmp_stop_btn.config(state="normal")
+                self._set_toggle_buttons("rtmp", True)
             except Exception as e:
                 messagebox.showerror("Erro", str(e))
         elif self.stream_manager.start_rtmp(url=url, bitrate=bitrate):
-            self.rtmp_start_btn.config(state="disabled")
-            self.rtmp_stop_btn.config(state="normal")
+            self._set_toggle_buttons("rtmp", True)
 
     def stop_rtmp(self):
         if USE_WORKER_RECORDING and self._worker_proc is not None:
             try:
                 with open(WORKER_RTMP_CMD_FILE, "w", encoding="utf-8") as f:
                     json.dump({"action": "stop"}, f)
-                self.rtmp_start_btn.config(state="normal")
-                self.rtmp_stop_btn.config(state="disabled")
+                self._set_toggle_buttons("rtmp", False)
             except Exception:
                 pass
         else:
             self.stream_manager.stop_rtmp()
-            self.rtmp_start_btn.config(state="normal")
-            self.rtmp_stop_btn.config(state="disabled")
+            self._rtmp_active = False
+            self._set_toggle_buttons("rtmp", False)
             self.rtmp_status_var.set("Inativo")
 
     def start_icecast(self):
@@ -976,48 +1290,43 @@ class CensuraDigitalInterface:
             try:
                 with open(WORKER_ICECAST_CMD_FILE, "w", encoding="utf-8") as f:
                     json.dump({"action": "start", "host": host, "port": port, "mount": mount, "password": password, "bitrate": bitrate}, f)
-                self.ice_start_btn.config(state="disabled")
-                self.ice_stop_btn.config(state="normal")
+                self._set_toggle_buttons("icecast", True)
             except Exception as e:
                 messagebox.showerror("Erro", str(e))
         elif self.stream_manager.start_icecast(host=host, port=port, mount=mount, password=password, bitrate=bitrate):
-            self.ice_start_btn.config(state="disabled")
-            self.ice_stop_btn.config(state="normal")
+            self._set_toggle_buttons("icecast", True)
 
     def stop_icecast(self):
         if USE_WORKER_RECORDING and self._worker_proc is not None:
             try:
                 with open(WORKER_ICECAST_CMD_FILE, "w", encoding="utf-8") as f:
                     json.dump({"action": "stop"}, f)
-                self.ice_start_btn.config(state="normal")
-                self.ice_stop_btn.config(state="disabled")
+                self._set_toggle_buttons("icecast", False)
             except Exception:
                 pass
         else:
             self.stream_manager.stop_icecast()
-            self.ice_start_btn.config(state="normal")
-            self.ice_stop_btn.config(state="disabled")
+            self._icecast_active = False
+            self._set_toggle_buttons("icecast", False)
             self.ice_status_var.set("Inativo")
 
     def save_streaming_config(self):
-        if "streaming" not in self.censura.config:
-            self.censura.config["streaming"] = {}
-        self.censura.config["streaming"]["rtmp"] = {
+        self._cfg_rtmp.update({
             "enabled": self.rtmp_autostart_var.get(),
             "url": self.rtmp_url_var.get().strip(),
             "audio_bitrate_kbps": self.rtmp_bitrate_var.get(),
-        }
-        self.censura.config["streaming"]["icecast"] = {
+        })
+        self._cfg_icecast.update({
             "enabled": self.ice_autostart_var.get(),
             "host": self.ice_host_var.get().strip(),
             "port": self.ice_port_var.get(),
             "mount": self.ice_mount_var.get().strip(),
             "source_password": self.ice_pass_var.get(),
             "audio_bitrate_kbps": self.ice_bitrate_var.get(),
-        }
+        })
         try:
-            self.censura.save_config()
-            self.stream_manager.reload_config(self.censura.config)
+            if self._save_config_if_changed():
+                self.stream_manager.reload_config(self.censura.config)
             messagebox.showinfo("Sucesso", "Configurações de streaming salvas!")
         except Exception as e:
             messagebox.showerror("Erro", f"Falha ao salvar: {e}")
@@ -1032,22 +1341,33 @@ class CensuraDigitalInterface:
         self.root.after(0, self._handle_recording_failed, message)
 
     def _handle_recording_failed(self, message):
-        self.start_btn.config(state="normal")
-        self.stop_btn.config(state="disabled")
+        self._set_toggle_buttons("rec", False)
         self.health_var.set("Falha ao iniciar gravação")
-        for child in self.root.winfo_children():
-            if isinstance(child, ttk.Notebook):
-                tabs = child.tabs()
-                if len(tabs) > 3:
-                    child.tab(tabs[3], state="normal")
+        self.notebook.tab(self._config_tab, state="normal")
         messagebox.showerror("Erro de Gravação", message)
 
     def _show_alert(self, message):
-        self.health_var.set(f"[{time.strftime('%H:%M:%S')}] {message}")
-        self.alert_var.set(f"[{time.strftime('%H:%M:%S')}] {message}")
+        text = _short_alert(f"[{time.strftime('%H:%M:%S')}] {message}")
+        self.health_var.set(text)
+        self.alert_var.set(text)
 
     def _on_stream_status(self, protocol, message):
-        self.root.after(0, self._update_stream_status, protocol, message)
+        # Rajadas de mensagens do FFmpeg viram um único refresh; só a última de cada protocolo é exibida
+        is_error = _ERR_RE.search(message) is not None
+        with self._pending_status_lock:
+            schedule = not self._pending_status
+            prev = self._pending_status.get(protocol)
+            self._pending_status[protocol] = (message, is_error or (prev is not None and prev[1]))
+        if schedule:
+            self.root.after_idle(self._flush_stream_status)
+
+    def _flush_stream_status(self):
+        with self._pending_status_lock:
+            pending, self._pending_status = self._pending_status, {}
+        for protocol, (message, is_error) in pending.items():
+            if is_error:
+                self._stream_error = True
+            self._update_stream_status(protocol, message)
 
     _ALERT_KEYWORDS = (
         "erro", "encerrou", "reconexão", "tentativa", "ciclo",
@@ -1055,25 +1375,21 @@ class CensuraDigitalInterface:
     )
 
     def _update_stream_status(self, protocol, message):
-        is_error = "erro" in message.lower() or "encerrou" in message.lower() or "não encontrado" in message.lower()
-        if is_error:
-            self._stream_error = True
-
         lower = message.lower()
         if any(kw in lower for kw in self._ALERT_KEYWORDS):
             ts = time.strftime('%H:%M:%S')
-            self.alert_var.set(f"[{ts}] {protocol.upper()}: {message}")
-
-        if protocol == "rtmp":
-            self.rtmp_status_var.set(message)
-            if not self.stream_manager._rtmp_active:
-                self.rtmp_start_btn.config(state="normal")
-                self.rtmp_stop_btn.config(state="disabled")
-        elif protocol == "icecast":
-            self.ice_status_var.set(message)
-            if not self.stream_manager._icecast_active:
-                self.ice_start_btn.config(state="normal")
-                self.ice_stop_btn.config(state="disabled")
+            _set_var_if_changed(self.alert_var, _short_alert(f"[{ts}] {protocol.upper()}: {message}"))
+
+        status_var = self._proto_status_vars.get(protocol)
+        if status_var is None:
+            return
+        _set_var_if_changed(status_var, message)
+        # _rtmp_active / _icecast_active espelham o flag de mesmo nome no StreamManager
+        active_attr = f"_{protocol}_active"
+        active = getattr(self.stream_manager, active_attr)
+        setattr(self, active_attr, active)
+        if not active:
+            self._set_toggle_buttons(protocol, False)
 
     # ── Processor / daily ─────────────────────────────────────────
 
@@ -1083,15 +1399,15 @@ class CensuraDigitalInterface:
         processor_win.grab_set()
 
     def _schedule_daily_processing(self, run_at_minutes_after_midnight: int = 5):
-        try:
-            now = datetime.now()
-            tomorrow = now.date() + timedelta(days=1)
+        if self._daily_deadline is None:
+            tomorrow = date.today() + timedelta(days=1)
             run_time = datetime.combine(tomorrow, datetime.min.time()) + timedelta(minutes=run_at_minutes_after_midnight)
-            delay_seconds = max(1, int((run_time - now).total_seconds()))
-        except Exception:
-            delay_seconds = 60
+            self._daily_deadline = run_time.timestamp()
+        delay_ms = int(max(1000, (self._daily_deadline - time.time()) * 1000))
 
         def run_job():
+            # Próxima execução recalculada pelo calendário (DST, suspensão longa)
+            self._daily_deadline = None
             try:
                 target_date = (date.today() - timedelta(days=1)).strftime("%Y-%m-%d")
 
@@ -1105,55 +1421,78 @@ class CensuraDigitalInterface:
                         except Exception:
                             pass
 
-                threading.Thread(target=worker, daemon=True).start()
+                self._proc_queue.put(worker)
             finally:
                 self._schedule_daily_processing(run_at_minutes_after_midnight)
 
-        self.root.after(delay_seconds * 1000, run_job)
+        self.root.after(delay_ms, run_job)
 
     # ── Device / config ───────────────────────────────────────────
 
-    def refresh_devices_list(self):
-        input_devices = [dev for dev in self.censura.get_audio_devices() if dev["maxInputChannels"] > 0]
-        default_entry = {
-            "index": None,
-            "name": "Padrão (recomendado se a gravação travar)",
-            "maxInputChannels": 1,
-            "maxOutputChannels": 0,
-            "defaultSampleRate": 44100,
-        }
-        self.audio_devices = [default_entry] + input_devices
-        self.device_combo["values"] = [
-            dev["name"] if dev["index"] is None else f"{dev['index']}: {dev['name']}"
-            for dev in self.audio_devices
+    def refresh_devices_list(self, force=False):
+        """Reusa a lista recente (exceto pelo botão Atualizar); senão enumera o PortAudio fora da thread do Tk."""
+        cached = self._devices_cache
+        if not force and cached is not None and time.monotonic() - cached[0] < DEVICES_CACHE_TTL_S:
+            self._apply_devices(cached[1])
+            return
+        if self._devices_enumerating:
+            return
+        self._devices_enumerating = True
+        threading.Thread(target=self._enumerate_devices_bg, daemon=True).start()
+
+    def _enumerate_devices_bg(self):
+        try:
+            devices = [dev for dev in self.censura.get_audio_devices() if dev["maxInputChannels"] > 0]
+        except Exception:
+            devices = []
+        self.root.after(0, self._on_devices_enumerated, devices)
+
+    def _on_devices_enumerated(self, input_devices):
+        self._devices_enumerating = False
+        formatted = self._format_devices(input_devices)
+        self._devices_cache = (time.monotonic(), formatted)
+        self._apply_devices(formatted)
+
+    @staticmethod
+    def _format_devices(input_devices):
+        # Entrada "Padrão" primeiro; rótulos e detalhes formatados uma única vez por enumeração
+        indices = [None]
+        in_ch = [1]
+        labels = ["Padrão (recomendado se a gravação travar)"]
+        details = [
+            "Usa o dispositivo de entrada padrão do Windows. Use esta opção se a gravação travar ou fechar o programa."
         ]
+        for dev in input_devices:
+            indices.append(dev["index"])
+            in_ch.append(dev["maxInputChannels"])
+            labels.append(f"{dev['index']}: {dev['name']}")
+            details.append(
+                f"Canais de Entrada: {dev['maxInputChannels']} | "
+                f"Canais de Saída: {dev['maxOutputChannels']} | "
+                f"Taxa Padrão: {int(dev['defaultSampleRate'])} Hz"
+            )
+        return indices, in_ch, labels, details
+
+    def _apply_devices(self, formatted):
+        indices, in_ch, labels, details = formatted
+        self._dev_indices = indices
+        self._dev_in_ch = in_ch
+        self._dev_details = details
+        self.device_combo["values"] = labels
         current_idx = self.censura.config["audio"].get("device_index")
-        for i, dev in enumerate(self.audio_devices):
-            if dev["index"] == current_idx:
-                self.device_combo.current(i)
-                self.on_device_select(None)
-                break
-        else:
-            if not self.audio_devices:
-                self.device_details_var.set("Nenhum dispositivo de entrada encontrado.")
-            elif current_idx is not None:
-                self.device_combo.current(0)
-                self.on_device_select(None)
+        try:
+            pos = indices.index(current_idx)
+        except ValueError:
+            pos = 0 if current_idx is not None else -1
+        if pos >= 0:
+            self.device_combo.current(pos)
+            self.on_device_select(None)
 
     def on_device_select(self, event):
         selected_idx = self.device_combo.current()
         if selected_idx < 0:
             return
-        device = self.audio_devices[selected_idx]
-        if device.get("index") is None:
-            details = "Usa o dispositivo de entrada padrão do Windows. Use esta opção se a gravação travar ou fechar o programa."
-        else:
-            details = (
-                f"Canais de Entrada: {device['maxInputChannels']} | "
-                f"Canais de Saída: {device['maxOutputChannels']} | "
-                f"Taxa Padrão: {int(device['defaultSampleRate'])} Hz"
-            )
-        self.device_details_var.set(details)
+        self.device_details_var.set(self._dev_details[selected_idx])
 
     def browse_directory(self):
         directory = filedialog.askdirectory(initialdir=self.output_dir_var.get(), title="Selecione o diretório para salvar as gravações")
@@ -1165,12 +1504,11 @@ class CensuraDigitalInterface:
         if selected_idx < 0:
             messagebox.showwarning("Nenhuma Seleção", "Por favor, selecione um dispositivo da lista.")
             return
-        device = self.audio_devices[selected_idx]
-        self.censura.config["audio"]["device_index"] = device["index"]
-        self.censura.config["audio"]["channels"] = device.get("maxInputChannels") or 1
+        self.censura.config["audio"]["device_index"] = self._dev_indices[selected_idx]
+        self.censura.config["audio"]["channels"] = self._dev_in_ch[selected_idx] or 1
         self.censura.config["recording"]["output_directory"] = self.output_dir_var.get()
         try:
-            self.censura.save_config()
+            self._save_config_if_changed()
             messagebox.showinfo("Sucesso", "Configurações salvas!")
         except Exception as e:
             messagebox.showerror("Erro ao Salvar", f"Não foi possível salvar: {e}")
@@ -1188,8 +1526,7 @@ class CensuraDigitalInterface:
             else:
                 self._do_start_recording_inprocess()
         except Exception as e:
-            self.start_btn.config(state="normal")
-            self.stop_btn.config(state="disabled")
+            self._set_toggle_buttons("rec", False)
             messagebox.showerror("Erro ao iniciar gravação", str(e))
 
     def _do_start_recording_worker(self):
@@ -1217,14 +1554,9 @@ class CensuraDigitalInterface:
         except Exception as e:
             messagebox.showerror("Erro ao iniciar gravador", str(e))
             return
-        self.start_btn.config(state="disabled")
-        self.stop_btn.config(state="normal")
+        self._set_toggle_buttons("rec", True)
         self.health_var.set("Gravação em andamento")
-        for child in self.root.winfo_children():
-            if isinstance(child, ttk.Notebook):
-                tabs = child.tabs()
-                if len(tabs) > 3:
-                    child.tab(tabs[3], state="disabled")
+        self.notebook.tab(self._config_tab, state="disabled")
         self._worker_status_poller()
 
     def _worker_status_poller(self):
@@ -1235,19 +1567,12 @@ class CensuraDigitalInterface:
             self._worker_proc = None
             self._cached_worker_data = None
             self._close_worker_stderr()
-            self.start_btn.config(state="normal")
-            self.stop_btn.config(state="disabled")
+            self._set_toggle_buttons("rec", False)
             self.health_var.set("Gravação parada")
-            self.rtmp_start_btn.config(state="normal")
-            self.rtmp_stop_btn.config(state="disabled")
+            self._set_toggle_buttons("rtmp", False)
             self.rtmp_status_var.set("Inativo")
-            self.ice_start_btn.config(state="normal")
-            self.ice_stop_btn.config(state="disabled")
-            for child in self.root.winfo_children():
-                if isinstance(child, ttk.Notebook):
-                    tabs = child.tabs()
-                    if len(tabs) > 3:
-                        child.tab(tabs[3], state="normal")
+            self._set_toggle_buttons("icecast", False)
+            self.notebook.tab(self._config_tab, state="normal")
             if ret != 0:
                 stderr_hint = ""
                 try:
@@ -1274,46 +1599,36 @@ class CensuraDigitalInterface:
                 with open(WORKER_STATUS_FILE, "r", encoding="utf-8") as f:
                     data = json.load(f)
                 if data.get("is_recording") and data.get("current_chunk_start"):
-                    start_time = datetime.fromisoformat(data["current_chunk_start"])
-                    elapsed = datetime.now() - start_time
-                    m, s = divmod(elapsed.total_seconds(), 60)
-                    self.status_var.set(f"Gravando chunk #{data.get('chunk_counter', 0)}...\nTempo: {int(m):02d}:{int(s):02d}")
-                self.rtmp_status_var.set(data.get("rtmp_status", "Inativo"))
-                self.ice_status_var.set(data.get("icecast_status", "Inativo"))
+                    m, s = divmod(self._chunk_elapsed_s(data["current_chunk_start"]), 60)
+                    _set_var_if_changed(
+                        self.status_var,
+                        f"Gravando chunk #{data.get('chunk_counter', 0)}...\nTempo: {m:02d}:{s:02d}",
+                    )
+                _set_var_if_changed(self.rtmp_status_var, data.get("rtmp_status", "Inativo"))
+                _set_var_if_changed(self.ice_status_var, data.get("icecast_status", "Inativo"))
                 rtmp_active = data.get("rtmp_active", False)
                 icecast_active = data.get("icecast_active", False)
-                self.rtmp_start_btn.config(state="disabled" if rtmp_active else "normal")
-                self.rtmp_stop_btn.config(state="normal" if rtmp_active else "disabled")
-                self.ice_start_btn.config(state="disabled" if icecast_active else "normal")
-                self.ice_stop_btn.config(state="normal" if icecast_active else "disabled")
+                self._set_toggle_buttons("rtmp", rtmp_active)
+                self._set_toggle_buttons("icecast", icecast_active)
         except Exception:
             pass
         if self._worker_proc is not None:
-            self.status_poller = self.root.after(1000, self._worker_status_poller)
+            self._worker_poll_id = self.root.after(1000, self._worker_status_poller)
 
     def _autostart_streams(self):
         """Auto-inicia RTMP e/ou Icecast se configurado como automático."""
         if not self._is_recording_active():
             return
-        streaming_cfg = self.censura.config.get("streaming", {})
-        rtmp_cfg = streaming_cfg.get("rtmp", {})
-        if rtmp_cfg.get("enabled") and not self.stream_manager._rtmp_active:
+        if self._cfg_rtmp.get("enabled") and not self.stream_manager._rtmp_active:
             self.start_rtmp()
-        ice_cfg = streaming_cfg.get("icecast", {})
-        if ice_cfg.get("enabled") and not self.stream_manager._icecast_active:
+        if self._cfg_icecast.get("enabled") and not self.stream_manager._icecast_active:
             self.start_icecast()
 
     def _do_start_recording_inprocess(self):
         if self.censura.start_recording(enable_monitoring=self.monitor_var.get()):
-            self.start_btn.config(state="disabled")
-            self.stop_btn.config(state="normal")
+            self._set_toggle_buttons("rec", True)
             self.health_var.set("Gravação em andamento")
-            for child in self.root.winfo_children():
-                if isinstance(child, ttk.Notebook):
-                    tabs = child.tabs()
-                    if len(tabs) > 3:
-                        child.tab(tabs[3], state="disabled")
-            self.update_status()
+            self.notebook.tab(self._config_tab, state="disabled")
             self.root.after(2000, self._autostart_streams)
         else:
             messagebox.showerror(
@@ -1324,15 +1639,15 @@ class CensuraDigitalInterface:
     def stop_recording(self):
         self.stream_manager.stop_all()
         self._stream_error = False
-        self.rtmp_start_btn.config(state="normal")
-        self.rtmp_stop_btn.config(state="disabled")
-        self.rtmp_status_var.set("Inativo")
-        self.ice_start_btn.config(state="normal")
-        self.ice_stop_btn.config(state="disabled")
-        self.ice_status_var.set("Inativo")
+        self._rtmp_active = False
+        self._icecast_active = False
+        self._set_toggle_buttons("rtmp", False)
+        _set_var_if_changed(self.rtmp_status_var, "Inativo")
+        self._set_toggle_buttons("icecast", False)
+        _set_var_if_changed(self.ice_status_var, "Inativo")
 
         if USE_WORKER_RECORDING and self._worker_proc is not None:
-            self.stop_btn.config(state="disabled")
+            self._set_toggle_buttons("rec", None)
             self.health_var.set("Parando gravação...")
             try:
                 open(WORKER_STOP_FILE, "w").close()
@@ -1353,16 +1668,9 @@ class CensuraDigitalInterface:
             return
 
         if self.censura.stop_recording():
-            self.start_btn.config(state="normal")
-            self.stop_btn.config(state="disabled")
+            self._set_toggle_buttons("rec", False)
             self.health_var.set("Gravação parada")
-            for child in self.root.winfo_children():
-                if isinstance(child, ttk.Notebook):
-                    tabs = child.tabs()
-                    if len(tabs) > 3:
-                        child.tab(tabs[3], state="normal")
-            if self.status_poller:
-                self.root.after_cancel(self.status_poller)
+            self.notebook.tab(self._config_tab, state="normal")
         else:
             messagebox.showwarning("Aviso", "A gravação já estava parada.")
 
@@ -1371,22 +1679,17 @@ class CensuraDigitalInterface:
         self._worker_proc = None
         self._cached_worker_data = None
         self._close_worker_stderr()
-        if self.status_poller:
-            self.root.after_cancel(self.status_poller)
-            self.status_poller = None
+        if self._worker_poll_id:
+            self.root.after_cancel(self._worker_poll_id)
+            self._worker_poll_id = None
         try:
             if os.path.exists(WORKER_STOP_FILE):
                 os.remove(WORKER_STOP_FILE)
         except Exception:
             pass
-        self.start_btn.config(state="normal")
-        self.stop_btn.config(state="disabled")
+        self._set_toggle_buttons("rec", False)
         self.health_var.set("Gravação parada")
-        for child in self.root.winfo_children():
-            if isinstance(child, ttk.Notebook):
-                tabs = child.tabs()
-                if len(tabs) > 3:
-                    child.tab(tabs[3], state="normal")
+        self.notebook.tab(self._config_tab, state="normal")
 
     def _close_worker_stderr(self):
         f = getattr(self, "_worker_stderr_file", None)
@@ -1397,39 +1700,66 @@ class CensuraDigitalInterface:
                 pass
             self._worker_stderr_file = None
 
-    def update_status(self):
+    def _on_recorder_status(self, status):
+        """Chamado pela thread de gravação; aplica o status na main thread."""
+        self.root.after(0, self._apply_status, status)
+
+    def _apply_status(self, status):
+        if not status.get("is_recording") or not status.get("current_chunk_start"):
+            return
         try:
-            if not self.censura.is_recording:
-                return
-            status = self.censura.get_status()
-            if status.get("current_chunk_start"):
-                start_time = datetime.fromisoformat(status["current_chunk_start"])
-                elapsed = datetime.now() - start_time
-                minutes, seconds = divmod(elapsed.total_seconds(), 60)
-                msg = f"Gravando chunk #{status['chunk_counter']}...\nTempo no chunk: {int(minutes):02d}:{int(seconds):02d}"
-                stalls = status.get("stall_count", 0)
-                if stalls > 0:
-                    msg += f"  |  Stalls: {stalls}"
-                stream_st = self.stream_manager.get_status()
-                parts = []
-                if stream_st.get("rtmp_active"):
-                    parts.append("RTMP")
-                if stream_st.get("icecast_active"):
-                    parts.append("Icecast")
-                if parts:
-                    msg += f"\nStreaming: {', '.join(parts)}"
-                self.status_var.set(msg)
+            minutes, seconds = divmod(self._chunk_elapsed_s(status["current_chunk_start"]), 60)
+            msg = f"Gravando chunk #{status['chunk_counter']}...\nTempo no chunk: {minutes:02d}:{seconds:02d}"
+            stalls = status.get("stall_count", 0)
+            if stalls > 0:
+                msg += f"  |  Stalls: {stalls}"
+            parts = []
+            if self._rtmp_active:
+                parts.append("RTMP")
+            if self._icecast_active:
+                parts.append("Icecast")
+            if parts:
+                msg += f"\nStreaming: {', '.join(parts)}"
         except Exception:
-            pass
-        if self.censura.is_recording:
-            self.status_poller = self.root.after(1000, self.update_status)
+            return
+        if msg != self._last_status_msg:
+            self._last_status_msg = msg
+            self.status_var.set(msg)
 
     def toggle_monitoring(self):
-        self.volume_slider.config(state="normal" if self.monitor_var.get() else "disabled")
+        if self.volume_slider is not None:
+            self.volume_slider.config(state="normal" if self.monitor_var.get() else "disabled")
         self.censura.is_monitoring = self.monitor_var.get()
 
     def set_volume(self, value):
-        self.censura.set_monitor_volume(float(value))
+        # Arrastar o slider gera um evento por pixel: aplica só o último valor da rajada
+        if self._vol_after_id:
+            self.root.after_cancel(self._vol_after_id)
+        self._vol_after_id = self.root.after(VOLUME_DEBOUNCE_MS, self._apply_volume, float(value))
+
+    def _apply_volume(self, volume):
+        self._vol_after_id = None
+        self.censura.set_monitor_volume(volume)
+
+    def _proc_worker_loop(self):
+        while True:
+            job = self._proc_queue.get()
+            if job is None:
+                return
+            try:
+                job()
+            except Exception:
+                # Registra no log do gravador (arquivo) e segue: o worker atende as próximas execuções
+                self.censura.logger.exception("Falha no processamento diário")
+
+    def _stop_proc_worker(self):
+        # Descarta processamentos diários ainda na fila; o que já está rodando morre com o processo
+        try:
+            while True:
+                self._proc_queue.get_nowait()
+        except queue.Empty:
+            pass
+        self._proc_queue.put(None)
 
     def on_closing(self):
         if self._monitor_poller:
@@ -1442,6 +1772,7 @@ class CensuraDigitalInterface:
             )
             if answer is True:
                 self.stream_manager.stop_all()
+                self._stop_proc_worker()
                 if USE_WORKER_RECORDING and self._worker_proc is not None:
                     try:
                         open(WORKER_STOP_FILE, "w").close()
@@ -1473,12 +1804,14 @@ class CensuraDigitalInterface:
                     self.censura.stop_recording()
                 self.root.destroy()
             elif answer is False:
+                self._stop_proc_worker()
                 self._close_worker_stderr()
                 self.root.destroy()
             else:
                 return
         else:
             self.stream_manager.stop_all()
+            self._stop_proc_worker()
             self._close_worker_stderr()
             self.root.destroy()
 
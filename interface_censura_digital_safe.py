@@ -9,6 +9,7 @@ from tkinter import ttk, messagebox, filedialog
 import sys
 import os
 import json
+import random
 import threading
 import time
 from pathlib import Path
@@ -32,6 +33,13 @@ class CensuraDigitalInterface:
         self.is_recording = False
         self.recording_time = 0
         
+        # Níveis simulados sorteados uma vez e percorridos em ciclo
+        self._sim_levels = random.choices(range(20, 81), k=1024)
+        self._sim_idx = 0
+        
+        # Pasta do dia: (data, caminho), recalculada só quando a data muda
+        self._today_cache = (None, None)
+        
         # Configurar estilo
         self.setup_ui()
         
@@ -245,8 +253,8 @@ class CensuraDigitalInterface:
         """Atualiza interface periodicamente"""
         # Simula nível de áudio
         if self.is_recording:
-            import random
-            level = random.randint(20, 80)
+            level = self._sim_levels[self._sim_idx & 1023]
+            self._sim_idx += 1
             self.level_var.set(level)
             self.level_label.config(text=f"Nível: {level}%")
             self.recording_time += 1
@@ -279,7 +287,10 @@ class CensuraDigitalInterface:
         """Abre pasta do dia atual"""
         from datetime import date
         today = date.today()
-        today_dir = Path("gravacoes_radio") / str(today.year) / f"{today.month:02d}-{today.strftime('%B')}" / f"{today.day:02d}"
+        cached_date, today_dir = self._today_cache
+        if cached_date != today:
+            today_dir = Path("gravacoes_radio") / str(today.year) / f"{today.month:02d}-{today.strftime('%B')}" / f"{today.day:02d}"
+            self._today_cache = (today, today_dir)
         
         if today_dir.exists():
             os.startfile(str(today_dir))
@@ -8,6 +8,9 @@ import sys
 import os
 import platform
 
+# Invariantes durante a vida do processo
+SYSTEM, RELEASE = platform.system(), platform.release()
+
 def main():
     print()
     print("  ALECE PLAY - SISTEMA DE CENSURA DIGITAL")
@@ -17,11 +20,15 @@ def main():
     if v < (3, 9):
         print(f"  Python {v.major}.{v.minor} detectado - requer 3.9+")
         return
-    print(f"  Python {v.major}.{v.minor}.{v.micro}  |  {platform.system()} {platform.release()}")
+    print(f"  Python {v.major}.{v.minor}.{v.micro}  |  {SYSTEM} {RELEASE}")
     print()
 
+    # Uma leitura do diretório em vez de um stat por arquivo; só o Windows ignora maiúsculas/minúsculas
+    fold_case = SYSTEM == "Windows"
+    with os.scandir(".") as it:
+        present = {entry.name.lower() if fold_case else entry.name for entry in it}
     for f in ("gravador_censura_digital.py", "interface_censura_digital.py", "stream_manager.py", "processador_audio.py"):
-        if not os.path.exists(f):
+        if f not in present:
             print(f"  ERRO: {f} nao encontrado. Execute no diretorio do projeto.")
             return
 
@@ -37,12 +37,26 @@ if errorlevel 1 (
     exit /b 1
 )
 
+REM Dry-run primeiro: se nada falta, pula upgrade do pip e instalacao (sem rede)
+set "PIP_CHECK=%TEMP%\censura_pip_check.txt"
+call "%PYTHON_EXE%" -m pip install --dry-run --disable-pip-version-check -r requirements.txt > "%PIP_CHECK%" 2>&1
+if errorlevel 1 goto :instalar
+findstr /C:"Would install" "%PIP_CHECK%" >nul
+if errorlevel 1 (
+    del "%PIP_CHECK%" >nul 2>&1
+    echo Dependencias ja satisfeitas.
+    goto :iniciar
+)
+
+:instalar
+del "%PIP_CHECK%" >nul 2>&1
+
 REM Atualiza pip silenciosamente (opcional)
 call "%PYTHON_EXE%" -m pip install --upgrade pip >nul 2>&1
 
 REM Instala requirements
 echo Instalando requirements (pode demorar na primeira vez)...
-call "%PYTHON_EXE%" -m pip install -r requirements.txt
+call "%PYTHON_EXE%" -m pip install --prefer-binary --no-input --disable-pip-version-check -r requirements.txt
 if errorlevel 1 (
     echo.
     echo ERRO: Falha ao instalar dependencias a partir de requirements.txt
@@ -52,6 +66,7 @@ if errorlevel 1 (
     exit /b 1
 )
 
+:iniciar
 echo.
 echo ===================================================
 echo  Iniciando a aplicacao Censura Digital (Modo Seguro)...
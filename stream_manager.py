@@ -29,6 +29,38 @@ RECONNECT_CYCLE_PAUSE = 300.0  # 5 min entre ciclos de reconexão
 METRICS_LOG_INTERVAL = 30.0
 
 
+class _FeedRing:
+    """Fila limitada de um produtor e um consumidor (gravação -> thread de feed do FFmpeg).
+
+    Usa queue.SimpleQueue (implementada em C, sem a Condition de queue.Queue nem o lock de
+    um Event a cada put) e um teste de tamanho para manter o limite de FEED_QUEUE_MAXSIZE.
+    """
+
+    __slots__ = ("maxsize", "_q")
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._q = queue.SimpleQueue()
+
+    def put_nowait(self, data) -> bool:
+        """Enfileira; retorna False (descarta) se a fila estiver cheia."""
+        q = self._q
+        if q.qsize() >= self.maxsize:
+            return False
+        q.put(data)
+        return True
+
+    def get(self, timeout: float):
+        """Retira o próximo item ou retorna None após timeout."""
+        try:
+            return self._q.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def qsize(self) -> int:
+        return self._q.qsize()
+
+
 @dataclass
 class StreamMetrics:
     """Métricas de throughput e qualidade por protocolo de streaming."""
@@ -106,8 +138,8 @@ class StreamManager:
         self._rtmp_process: Optional[subprocess.Popen] = None
         self._icecast_process: Optional[subprocess.Popen] = None
 
-        self._rtmp_queue: Optional[queue.Queue] = None
-        self._icecast_queue: Optional[queue.Queue] = None
+        self._rtmp_queue: Optional[_FeedRing] = None
+        self._icecast_queue: Optional[_FeedRing] = None
 
         self._rtmp_active = False
         self._icecast_active = False
@@ -266,14 +298,14 @@ class StreamManager:
         while getattr(self, f"_{protocol}_active", False):
             if proc.poll() is not None:
                 break
+            data = q.get(timeout=1.0)
+            if data is None:
+                continue
             try:
-                data = q.get(timeout=1.0)
                 proc.stdin.write(data)
                 proc.stdin.flush()
                 metrics.bytes_fed += len(data)
                 metrics.frames_sent += 1
-            except queue.Empty:
-                continue
             except (BrokenPipeError, OSError) as exc:
                 metrics.last_error = str(exc)
                 self.logger.warning("[%s] Feed loop interrompido: %s", protocol.upper(), exc)
@@ -404,7 +436,7 @@ class StreamManager:
         ]
 
         try:
-            self._rtmp_queue = queue.Queue(maxsize=FEED_QUEUE_MAXSIZE)
+            self._rtmp_queue = _FeedRing(FEED_QUEUE_MAXSIZE)
             self._rtmp_process = subprocess.Popen(
                 cmd,
                 stdin=subprocess.PIPE,
@@ -509,7 +541,7 @@ class StreamManager:
         ]
 
         try:
-            self._icecast_queue = queue.Queue(maxsize=FEED_QUEUE_MAXSIZE)
+            self._icecast_queue = _FeedRing(FEED_QUEUE_MAXSIZE)
             self._icecast_process = subprocess.Popen(
                 cmd,
                 stdin=subprocess.PIPE,
@@ -578,14 +610,14 @@ class StreamManager:
         now = time.time()
         data_len = len(data)
 
-        if self._rtmp_active and self._rtmp_queue is not None:
-            try:
-                self._rtmp_queue.put_nowait(data)
+        ring = self._rtmp_queue
+        if self._rtmp_active and ring is not None:
+            if ring.put_nowait(data):
                 self._rtmp_metrics.last_feed_ts = now
-                qsize = self._rtmp_queue.qsize()
+                qsize = ring.qsize()
                 if qsize > self._rtmp_metrics.queue_high_watermark:
                     self._rtmp_metrics.queue_high_watermark = qsize
-            except queue.Full:
+            else:
                 self._rtmp_metrics.frames_dropped += 1
                 if self._rtmp_metrics.frames_dropped % 100 == 1:
                     self.logger.warning(
@@ -593,14 +625,14 @@ class StreamManager:
                         self._rtmp_metrics.frames_dropped,
                     )
 
-        if self._icecast_active and self._icecast_queue is not None:
-            try:
-                self._icecast_queue.put_nowait(data)
+        ring = self._icecast_queue
+        if self._icecast_active and ring is not None:
+            if ring.put_nowait(data):
                 self._icecast_metrics.last_feed_ts = now
-                qsize = self._icecast_queue.qsize()
+                qsize = ring.qsize()
                 if qsize > self._icecast_metrics.queue_high_watermark:
                     self._icecast_metrics.queue_high_watermark = qsize
-            except queue.Full:
+            else:
                 self._icecast_metrics.frames_dropped += 1
                 if self._icecast_metrics.frames_dropped % 100 == 1:
                     self.logger.warning(
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Testes dos helpers puros do Sistema de Censura Digital (sem dispositivo de áudio)
+
+Uso: python teste_helpers.py   (ou python -m unittest teste_helpers)
+Os testes do gravador exigem numpy e pyaudio instalados; sem eles são pulados.
+"""
+
+import bisect
+import math
+import os
+import struct
+import tempfile
+import unittest
+import wave
+
+import audio_backend
+from audio_backend import DeviceTable, _block_frames, _downmix_stereo_int16, _normalize_blocksize
+
+try:
+    import gravador_censura_digital as gravador
+except ImportError:
+    gravador = None
+
+try:
+    import interface_censura_digital as interface
+except ImportError:
+    interface = None
+
+
+def _ler_wav(path):
+    with wave.open(path, "rb") as r:
+        return r.getparams(), r.readframes(r.getnframes())
+
+
+@unittest.skipIf(gravador is None, "gravador requer numpy e pyaudio")
+class TesteWavChunkWriter(unittest.TestCase):
+    """Cabeçalho RIFF escrito na abertura e corrigido no close() quando o total difere."""
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".wav")
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def _gravar(self, blocos, declarado, channels=1, sampwidth=2, rate=8000):
+        with gravador._WavChunkWriter(self.path, channels, sampwidth, rate, declarado) as wf:
+            for bloco in blocos:
+                wf.write(bloco)
+        # No POSIX o fsync/close roda num thread auxiliar; o conteúdo já foi escrito com flush
+        return _ler_wav(self.path)
+
+    def test_chunk_exato(self):
+        pcm = struct.pack("<4h", 1, -1, 32767, -32768) * 100
+        params, frames = self._gravar([pcm], len(pcm))
+        self.assertEqual((params.nchannels, params.sampwidth, params.framerate), (1, 2, 8000))
+        self.assertEqual(params.nframes, len(pcm) // 2)
+        self.assertEqual(frames, pcm)
+
+    def test_chunk_curto_corrige_cabecalho(self):
+        pcm = b"\x01\x02" * 300
+        params, frames = self._gravar([pcm[:400], pcm[400:]], declarado=10 * len(pcm))
+        self.assertEqual(params.nframes, 300)
+        self.assertEqual(frames, pcm)
+
+    def test_chunk_excedente_corrige_cabecalho(self):
+        pcm = b"\x03\x04" * 500
+        params, frames = self._gravar([pcm], declarado=200)
+        self.assertEqual(params.nframes, 500)
+        self.assertEqual(frames, pcm)
+
+    def test_tamanho_impar_recebe_byte_de_preenchimento(self):
+        pcm = bytes(range(1, 102))  # 101 bytes, 8 bits mono
+        params, frames = self._gravar([pcm], declarado=200, sampwidth=1)
+        self.assertEqual(params.nframes, 101)
+        self.assertEqual(frames, pcm)
+        self.assertEqual(os.path.getsize(self.path), 44 + 101 + 1)
+
+    def test_estereo(self):
+        pcm = struct.pack("<6h", 1, 2, 3, 4, 5, 6)
+        params, frames = self._gravar([pcm], declarado=len(pcm), channels=2)
+        self.assertEqual((params.nchannels, params.nframes), (2, 3))
+        self.assertEqual(frames, pcm)
+
+
+@unittest.skipIf(gravador is None, "gravador requer numpy e pyaudio")
+class TesteProcessChunk(unittest.TestCase):
+
+    def test_silencio(self):
+        rms, scaled = gravador._process_chunk(bytes(2048), None)
+        self.assertEqual(rms, 0.0)
+        self.assertIsNone(scaled)
+
+    def test_escala_total(self):
+        pcm = struct.pack("<2h", 32767, -32768) * 256
+        rms, _ = gravador._process_chunk(pcm, None)
+        self.assertAlmostEqual(rms, 1.0, places=3)
+
+    def test_volume_unitario_devolve_o_proprio_bloco(self):
+        pcm = struct.pack("<4h", 100, -100, 200, -200)
+        _, scaled = gravador._process_chunk(pcm, 1.0)
+        self.assertIs(scaled, pcm)
+
+    def test_volume_satura_em_int16(self):
+        pcm = struct.pack("<3h", 25000, -25000, 1000)
+        rms, scaled = gravador._process_chunk(pcm, 1.5, level=False)
+        self.assertIsNone(rms)
+        self.assertEqual(struct.unpack("<3h", scaled), (32767, -32768, 1500))
+
+
+class TesteBlocksize(unittest.TestCase):
+
+    def test_potencia_de_2_mais_proxima(self):
+        self.assertEqual(_normalize_blocksize(44100, 600), 512)
+        self.assertEqual(_normalize_blocksize(44100, 1000), 1024)
+        self.assertEqual(_normalize_blocksize(44100, 1024), 1024)
+        self.assertEqual(_normalize_blocksize(44100, 768), 512)  # empate: menor latência
+
+    def test_limites(self):
+        self.assertEqual(_normalize_blocksize(44100, 1), 16)
+        self.assertEqual(_normalize_blocksize(44100, 4096), 1024)  # teto de 40 ms
+        self.assertEqual(_normalize_blocksize(8000, 1024), 256)
+
+    def test_tamanho_explicito_nao_e_alterado(self):
+        self.assertEqual(_block_frames(44100, 2048), 2048)
+        self.assertEqual(_block_frames(8000, 1000), 1000)
+        self.assertEqual(_block_frames(44100, None), _normalize_blocksize(44100, audio_backend.DEFAULT_BLOCKSIZE))
+
+
+class TesteDeviceTable(unittest.TestCase):
+
+    def setUp(self):
+        self.tabela = DeviceTable.from_rows([
+            (0, "Microfone", 2, 0, 44100.0),
+            (3, "Alto-falantes", 0, 2, 48000.0),
+        ])
+
+    def test_colunas_e_linhas(self):
+        self.assertEqual(len(self.tabela), 2)
+        self.assertEqual(self.tabela.indices, (0, 3))
+        self.assertEqual(self.tabela[1]["name"], "Alto-falantes")
+        self.assertEqual([d["maxInputChannels"] for d in self.tabela], [2, 0])
+        self.assertEqual(self.tabela.input_positions(), [0])
+
+    def test_somente_leitura(self):
+        with self.assertRaises(TypeError):
+            self.tabela[0]["name"] = "outro"
+        with self.assertRaises(AttributeError):
+            self.tabela.names = ()
+
+    def test_vazia(self):
+        vazia = DeviceTable.from_rows([])
+        self.assertEqual(len(vazia), 0)
+        self.assertEqual(list(vazia), [])
+
+
+class TesteDownmix(unittest.TestCase):
+
+    def test_tamanho_invalido(self):
+        # A validação vem antes de qualquer uso do numpy
+        with self.assertRaises(ValueError):
+            _downmix_stereo_int16(None, b"\x00" * 6)
+
+
+@unittest.skipIf(interface is None, "interface requer tkinter")
+class TesteTabelaVU(unittest.TestCase):
+    """A tabela por bisect deve arredondar como f"{20*log10(nível):+.1f}"."""
+
+    def _rotulo(self, nivel):
+        return interface._VU_LABELS[bisect.bisect_right(interface._VU_LEVEL_BOUNDS, nivel)]
+
+    def test_arredonda_como_log10(self):
+        for nivel in (0.001, 0.0123, 0.05, 0.1, 0.3162, 0.5, 0.7071, 0.99, 1.0):
+            db = max(-60.0, 20 * math.log10(nivel))
+            self.assertEqual(self._rotulo(nivel), f"{db:+.1f} dBFS", nivel)
+
+    def test_extremos(self):
+        self.assertEqual(self._rotulo(0.0), "-60.0 dBFS")
+        self.assertEqual(self._rotulo(1.0), "+0.0 dBFS")
+
+
+if __name__ == "__main__":
+    unittest.main()